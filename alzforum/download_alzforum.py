@@ -13,14 +13,18 @@ IMPORTANT:
 """
 
 import csv
-import time
+import json
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import List, Dict, Optional, Callable
+from typing import List, Dict, Optional, Callable, Tuple
 
+import lxml.html
 import requests
-from bs4 import BeautifulSoup
+from lxml import etree
 from tqdm import tqdm
 
+from .http_utils import SESSION, RateLimiter, fetch_html, http_get
+
 # --------------------------
 # PATHS & BASIC CONFIG
 # --------------------------
@@ -44,106 +48,200 @@ for d in [ALZPEDIA_HTML_DIR, ALZBIOMARKER_HTML_DIR, ALZRISK_HTML_DIR, THERAPEUTI
 
 
 # --------------------------
-# HTTP HELPERS
+# CONDITIONAL GET (ETag / Last-Modified)
 # --------------------------
 
-# Use a browser-like user-agent to reduce chances of 403
-DEFAULT_HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0 Safari/537.36"
-    ),
-    "Accept-Language": "en-US,en;q=0.9",
-}
+def load_validators(path: Path) -> Dict[str, Dict[str, str]]:
+    """Load the URL -> {etag, last_modified} sidecar written by a previous run."""
+    if not path.exists():
+        return {}
+    with path.open("r", encoding="utf-8") as f:
+        return json.load(f)
 
 
-def fetch_html(url: str, sleep_seconds: float = 0.5) -> Optional[str]:
-    """Fetch HTML from a URL with basic error handling and politeness delays."""
-    try:
-        resp = requests.get(url, headers=DEFAULT_HEADERS, timeout=30)
-        if resp.status_code != 200:
-            print(f"[WARN] got status {resp.status_code} for {url}")
-            return None
-        time.sleep(sleep_seconds)
-        return resp.text
-    except requests.RequestException as e:
-        print(f"[ERROR] Request failed for {url}: {e}")
+def save_validators(path: Path, validators: Dict[str, Dict[str, str]]) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(validators, indent=1, sort_keys=True), encoding="utf-8")
+
+
+def download_to(
+    url: str,
+    dest: Path,
+    validators: Optional[Dict[str, str]] = None,
+    limiter: Optional[RateLimiter] = None,
+) -> Optional[Dict[str, str]]:
+    """
+    Download one page into `dest` and return its cache validators
+    ({"etag": ..., "last_modified": ...}), or None if the fetch failed.
+
+    The body is streamed to disk as raw bytes (no decode/re-encode through
+    a Python str) via a '.part' file, so an interrupted download never
+    leaves a truncated page that later runs would treat as complete.
+
+    When `dest` already exists and validators from a previous run are given,
+    the GET is conditional (If-None-Match / If-Modified-Since); a 304 reply
+    costs one round trip and leaves `dest` untouched.
+    """
+    headers: Dict[str, str] = {}
+    if validators and dest.exists():
+        if validators.get("etag"):
+            headers["If-None-Match"] = validators["etag"]
+        if validators.get("last_modified"):
+            headers["If-Modified-Since"] = validators["last_modified"]
+
+    resp = http_get(url, headers=headers, stream=True, limiter=limiter)
+    if resp is None:
         return None
 
+    with resp:
+        if resp.status_code == 304:
+            return validators
+
+        dest.parent.mkdir(parents=True, exist_ok=True)
+        part = dest.with_name(dest.name + ".part")
+        try:
+            with part.open("wb") as f:
+                for chunk in resp.iter_content(chunk_size=64 * 1024):
+                    f.write(chunk)
+        except (requests.RequestException, OSError) as e:
+            print(f"[ERROR] Download failed for {url}: {e}")
+            part.unlink(missing_ok=True)
+            return None
+        part.replace(dest)
 
-def save_text(path: Path, text: str) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.write_text(text, encoding="utf-8")
+    return {
+        key: value
+        for key, value in (
+            ("etag", resp.headers.get("ETag")),
+            ("last_modified", resp.headers.get("Last-Modified")),
+        )
+        if value
+    }
+
+
+def head_if_cached(url: str, cached_size: int, limiter: Optional[RateLimiter] = None) -> bool:
+    """
+    HEAD preflight for pages the server gave no ETag / Last-Modified for:
+    True when the reported Content-Length equals the size of our copy, so
+    the full GET can be skipped. Asks for an identity encoding so the
+    length is comparable with the bytes on disk; any error means "fetch".
+    """
+    if limiter is not None:
+        limiter.wait()
+    try:
+        resp = SESSION.head(url, headers={"Accept-Encoding": "identity"}, timeout=30, allow_redirects=True)
+    except requests.RequestException:
+        return False
+    if limiter is not None:
+        limiter.observe(resp)
+    return resp.status_code == 200 and resp.headers.get("Content-Length") == str(cached_size)
 
 
 # --------------------------
 # INDEX BUILDERS
 # --------------------------
 
-def build_alzpedia_index(index_path: Path) -> None:
-    """
-    Build an index of AlzPedia entities.
+_ANCHORS = etree.XPath("//a[@href]")
+# Landing pages are UTF-8; pin it so bytes without a <meta charset> don't
+# fall back to libxml2's Latin-1 default.
+_HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8")
 
-    Strategy (approximate):
-    - Fetch an AlzPedia index page that lists entries.
-    - Collect <a> tags whose href looks like '/alzpedia/<slug>'.
-    - Avoid sub-URLs like '/alzpedia/papers/...'.
 
-    NOTE:
-    - The selectors here are *guesses*.
-      Open https://www.alzforum.org/alzpedia in your browser,
-      inspect the HTML, and adjust the logic if necessary.
+def page_links(html: str | bytes) -> List[Tuple[str, str]]:
+    """All (href, stripped link text) pairs on a landing page, in document order."""
+    doc = lxml.html.fromstring(html, parser=_HTML_PARSER)
+    # Each text node stripped and joined with no separator, exactly like
+    # bs4's a.get_text(strip=True), so index titles/names are unchanged.
+    return [
+        (a.get("href"), "".join(s.strip() for s in a.itertext()))
+        for a in _ANCHORS(doc)
+    ]
+
+
+def write_index(index_path: Path, fieldnames: List[str], records: List[Tuple[str, ...]]) -> None:
+    with index_path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.writer(f)
+        writer.writerow(fieldnames)
+        writer.writerows(records)
+
+
+def build_link_index(
+    base_url: str,
+    href_prefix: str,
+    fieldnames: List[str],
+    index_path: Path,
+    tag: str,
+    noun: str = "candidate entries",
+    skip_substrings: Tuple[str, ...] = (),
+) -> None:
+    """
+    Shared scrape-and-index routine behind the landing-page builders.
+
+    Fetches `base_url`, keeps links whose href starts with `href_prefix`
+    (e.g. '/therapeutics/'), has at least one path segment after it and
+    contains none of `skip_substrings`, dedupes them on their last path
+    segment (the slug), and writes (slug, absolute URL, link text) rows
+    under `fieldnames` to `index_path`. `tag` prefixes the log lines.
     """
-    base_url = "https://www.alzforum.org/alzpedia"
-    print(f"[ALZPEDIA] Fetching index page: {base_url}")
+    print(f"[{tag}] Fetching index page: {base_url}")
     html = fetch_html(base_url)
     if html is None:
-        print("[ALZPEDIA] Failed to fetch index; please build index manually.")
+        print(f"[{tag}] Failed to fetch index; please build index manually.")
         return
 
-    soup = BeautifulSoup(html, "lxml")
-    links = soup.find_all("a", href=True)
-
-    records: List[Dict[str, str]] = []
+    records: List[Tuple[str, str, str]] = []
     seen = set()
 
-    for a in links:
-        href = a["href"]
-        # Example pattern: '/alzpedia/app'
-        if not href.startswith("/alzpedia/"):
+    for href, link_text in page_links(html):
+        if not href.startswith(href_prefix):
             continue
-        if "/papers/" in href:
-            # skip paper-style entries
+        if any(sub in href for sub in skip_substrings):
+            continue
+
+        head, _, slug = href.strip("/").rpartition("/")
+        if not head:
+            # e.g., '/therapeutics'
             continue
 
-        full_url = "https://www.alzforum.org" + href
-        slug = href.split("/")[-1]
         if slug in seen:
             continue
         seen.add(slug)
 
-        title_text = a.get_text(strip=True)
-        records.append(
-            {
-                "entity_id": slug,
-                "url": full_url,
-                "title": title_text,
-            }
-        )
+        full_url = "https://www.alzforum.org" + href
+        records.append((slug, full_url, link_text))
 
     if not records:
-        print("[ALZPEDIA] WARNING: no records found – check selectors.")
+        print(f"[{tag}] WARNING: no records found – check selectors.")
     else:
-        print(f"[ALZPEDIA] Found {len(records)} candidate entries.")
+        print(f"[{tag}] Found {len(records)} {noun}.")
 
-    # Write CSV
-    with index_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["entity_id", "url", "title"])
-        writer.writeheader()
-        writer.writerows(records)
+    write_index(index_path, fieldnames, records)
+
+    print(f"[{tag}] Index saved to {index_path}")
+
+
+def build_alzpedia_index(index_path: Path) -> None:
+    """
+    Build an index of AlzPedia entities.
 
-    print(f"[ALZPEDIA] Index saved to {index_path}")
+    Strategy (approximate):
+    - Fetch an AlzPedia index page that lists entries.
+    - Collect <a> tags whose href looks like '/alzpedia/<slug>'.
+    - Avoid sub-URLs like '/alzpedia/papers/...'.
+
+    NOTE:
+    - The selectors here are *guesses*.
+      Open https://www.alzforum.org/alzpedia in your browser,
+      inspect the HTML, and adjust the logic if necessary.
+    """
+    build_link_index(
+        "https://www.alzforum.org/alzpedia",
+        "/alzpedia/",
+        ["entity_id", "url", "title"],
+        index_path,
+        tag="ALZPEDIA",
+        skip_substrings=("/papers/",),
+    )
 
 
 def build_alzbiomarker_index(index_path: Path) -> None:
@@ -158,19 +256,16 @@ def build_alzbiomarker_index(index_path: Path) -> None:
     """
 
     RECORDS = [
-        {
-            "biomarker_id": "versioning_history",
-            "url": "https://www.alzforum.org/alzbiomarker/about-alzbiomarker/versioning-history",
-            "name": "AlzBiomarker Versioning History",
-        }
+        (
+            "versioning_history",
+            "https://www.alzforum.org/alzbiomarker/about-alzbiomarker/versioning-history",
+            "AlzBiomarker Versioning History",
+        )
     ]
 
     print(f"[ALZBIOMARKER] Building index with {len(RECORDS)} entry (versioning history page).")
 
-    with index_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["biomarker_id", "url", "name"])
-        writer.writeheader()
-        writer.writerows(RECORDS)
+    write_index(index_path, ["biomarker_id", "url", "name"], RECORDS)
 
     print(f"[ALZBIOMARKER] Index saved to {index_path}")
 
@@ -185,56 +280,14 @@ def build_alzrisk_index(index_path: Path) -> None:
 
     You may need to refine which <a> tags to use based on the page structure.
     """
-    base_url = "https://www.alzforum.org/alzrisk"
-    print(f"[ALZRISK] Fetching index page: {base_url}")
-    html = fetch_html(base_url)
-    if html is None:
-        print("[ALZRISK] Failed to fetch index; please build index manually.")
-        return
-
-    soup = BeautifulSoup(html, "lxml")
-    links = soup.find_all("a", href=True)
-
-    records: List[Dict[str, str]] = []
-    seen = set()
-
-    for a in links:
-        href = a["href"]
-        if not href.startswith("/alzrisk/"):
-            continue
-
-        # skip obvious non-risk pages if needed (e.g., '/alzrisk' or '/alzrisk/tools')
-        parts = href.strip("/").split("/")
-        if len(parts) < 2:
-            # e.g., '/alzrisk'
-            continue
-
-        slug = parts[-1]
-        if slug in seen:
-            continue
-        seen.add(slug)
-
-        full_url = "https://www.alzforum.org" + href
-        title_text = a.get_text(strip=True)
-        records.append(
-            {
-                "risk_factor_id": slug,
-                "url": full_url,
-                "name": title_text,
-            }
-        )
-
-    if not records:
-        print("[ALZRISK] WARNING: no records found – check selectors.")
-    else:
-        print(f"[ALZRISK] Found {len(records)} candidate risk factor entries.")
-
-    with index_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["risk_factor_id", "url", "name"])
-        writer.writeheader()
-        writer.writerows(records)
-
-    print(f"[ALZRISK] Index saved to {index_path}")
+    build_link_index(
+        "https://www.alzforum.org/alzrisk",
+        "/alzrisk/",
+        ["risk_factor_id", "url", "name"],
+        index_path,
+        tag="ALZRISK",
+        noun="candidate risk factor entries",
+    )
 
 
 def build_therapeutics_index(index_path: Path) -> None:
@@ -250,56 +303,14 @@ def build_therapeutics_index(index_path: Path) -> None:
       Sometimes the site provides a filterable table or a dedicated listing page.
       Once you know that URL, replace `base_url` below if needed.
     """
-    base_url = "https://www.alzforum.org/therapeutics"
-    print(f"[THERAPEUTICS] Fetching index page: {base_url}")
-    html = fetch_html(base_url)
-    if html is None:
-        print("[THERAPEUTICS] Failed to fetch index; please build index manually.")
-        return
-
-    soup = BeautifulSoup(html, "lxml")
-    links = soup.find_all("a", href=True)
-
-    records: List[Dict[str, str]] = []
-    seen = set()
-
-    for a in links:
-        href = a["href"]
-        # Example pattern: '/therapeutics/lecanemab'
-        if not href.startswith("/therapeutics/"):
-            continue
-
-        parts = href.strip("/").split("/")
-        if len(parts) < 2:
-            # e.g., '/therapeutics'
-            continue
-
-        slug = parts[-1]
-        if slug in seen:
-            continue
-        seen.add(slug)
-
-        full_url = "https://www.alzforum.org" + href
-        name = a.get_text(strip=True)
-        records.append(
-            {
-                "therapeutic_id": slug,
-                "url": full_url,
-                "name": name,
-            }
-        )
-
-    if not records:
-        print("[THERAPEUTICS] WARNING: no records found – check selectors.")
-    else:
-        print(f"[THERAPEUTICS] Found {len(records)} candidate therapeutics.")
-
-    with index_path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=["therapeutic_id", "url", "name"])
-        writer.writeheader()
-        writer.writerows(records)
-
-    print(f"[THERAPEUTICS] Index saved to {index_path}")
+    build_link_index(
+        "https://www.alzforum.org/therapeutics",
+        "/therapeutics/",
+        ["therapeutic_id", "url", "name"],
+        index_path,
+        tag="THERAPEUTICS",
+        noun="candidate therapeutics",
+    )
 
 
 # --------------------------
@@ -312,10 +323,26 @@ def download_from_index(
     url_column: str,
     target_dir: Path,
     sleep_seconds: float = 0.5,
+    concurrency: int = 8,
+    revalidate: bool = False,
 ) -> None:
     """
     Given an index CSV with ID + URL columns, download each page HTML
     into target_dir as '<id>.html', skipping files that already exist.
+
+    Pages are fetched by a small thread pool sharing SESSION, so at most
+    `concurrency` requests are in flight against the host at once. Request
+    starts are paced by one shared RateLimiter spaced `sleep_seconds`
+    apart, which also honours Retry-After on 429/503: the request rate
+    stays capped at 1/sleep_seconds per second as in a sequential crawl,
+    and the workers only overlap the latency of in-flight requests.
+
+    ETag / Last-Modified headers are recorded per URL in
+    processed/<source>_etags.json. With `revalidate=True`, existing files
+    that have recorded validators are re-checked with a conditional GET
+    and only rewritten when the server reports a change; existing files
+    without validators get a HEAD preflight instead and are only
+    re-downloaded when the Content-Length differs from the file size.
     """
     if not index_path.exists():
         print(f"[DOWNLOAD] Index file not found: {index_path}, skipping.")
@@ -328,19 +355,36 @@ def download_from_index(
 
     print(f"[DOWNLOAD] {len(rows)} rows found in index.")
 
-    for row in tqdm(rows, desc=f"Downloading to {target_dir.name}"):
-        item_id = row[id_column]
-        url = row[url_column]
-        dest = target_dir / f"{item_id}.html"
+    validators_path = PROCESSED_DIR / f"{target_dir.name}_etags.json"
+    validators = load_validators(validators_path)
 
-        if dest.exists():
+    pending = []
+    for row in rows:
+        url = row[url_column]
+        dest = target_dir / f"{row[id_column]}.html"
+        if dest.exists() and not revalidate:
             continue
+        pending.append((url, dest))
+
+    limiter = RateLimiter(sleep_seconds)
 
-        html = fetch_html(url, sleep_seconds=sleep_seconds)
-        if html is None:
+    def fetch_one(url: str, dest: Path) -> Tuple[str, Optional[Dict[str, str]]]:
+        if url not in validators and dest.exists() and head_if_cached(url, dest.stat().st_size, limiter):
+            return url, None
+        page_validators = download_to(url, dest, validators.get(url), limiter=limiter)
+        if page_validators is None:
             print(f"[DOWNLOAD] Failed to fetch {url}, skipping.")
-            continue
-        save_text(dest, html)
+        return url, page_validators
+
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = [pool.submit(fetch_one, url, dest) for url, dest in pending]
+        for fut in tqdm(as_completed(futures), total=len(futures), desc=f"Downloading to {target_dir.name}"):
+            url, page_validators = fut.result()
+            if page_validators:
+                validators[url] = page_validators
+
+    if pending:
+        save_validators(validators_path, validators)
 
 
 # --------------------------
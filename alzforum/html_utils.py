@@ -0,0 +1,30 @@
+"""
+html_utils.py
+
+lxml helpers shared by the Alzforum process_* scripts (stand-ins for the
+BeautifulSoup calls they replaced).
+"""
+
+from __future__ import annotations
+
+import lxml.html
+from lxml import etree
+
+# Blank-only text nodes and comments never contribute to extracted text,
+# so drop them at parse time for a smaller tree. Pages are handed over as
+# raw bytes; pin UTF-8 so pages without a <meta charset> don't fall back
+# to libxml2's Latin-1 default.
+HTML_PARSER = lxml.html.HTMLParser(encoding="utf-8", remove_blank_text=True, remove_comments=True)
+
+# Descendant text nodes, skipping <script>/<style> bodies (as bs4's get_text does)
+_TEXT_NODES = etree.XPath("descendant::text()[not(ancestor::script or ancestor::style)]")
+
+
+def node_text(el, sep: str = " ") -> str:
+    """lxml equivalent of BeautifulSoup's `el.get_text(sep, strip=True)`."""
+    return sep.join(t for t in (s.strip() for s in _TEXT_NODES(el)) if t)
+
+
+def has_class(tag: str, cls: str) -> str:
+    """XPath (relative) matching descendant <tag> elements carrying CSS class `cls`."""
+    return f".//{tag}[contains(concat(' ', normalize-space(@class), ' '), ' {cls} ')]"
@@ -0,0 +1,154 @@
+"""
+http_utils.py
+
+Shared HTTP layer for the Alzforum scripts: one keep-alive session with
+browser-like headers, a thread-safe RateLimiter that honours 429/503
+Retry-After, and GET helpers built on both.
+"""
+
+from __future__ import annotations
+
+import threading
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Dict, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+BASE_URL = "https://www.alzforum.org"
+
+# Use a browser-like user-agent to reduce chances of 403
+DEFAULT_HEADERS = {
+    "User-Agent": (
+        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
+        "AppleWebKit/537.36 (KHTML, like Gecko) "
+        "Chrome/120.0 Safari/537.36"
+    ),
+    "Accept-Language": "en-US,en;q=0.9",
+}
+
+# One shared session so every page on www.alzforum.org reuses the same
+# keep-alive connection instead of paying a new TCP + TLS handshake per URL.
+# The adapter only retries server errors; 429/503 are left to http_get so the
+# RateLimiter sees them and honours Retry-After for every worker.
+SESSION = requests.Session()
+SESSION.headers.update(DEFAULT_HEADERS)
+SESSION.mount(
+    BASE_URL,
+    HTTPAdapter(
+        pool_connections=1,
+        pool_maxsize=16,
+        max_retries=Retry(
+            total=5,
+            backoff_factor=0.5,
+            status_forcelist=[500, 502, 504],
+        ),
+    ),
+)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header (delta-seconds or HTTP-date)."""
+    if not value:
+        return None
+    value = value.strip()
+    if value.isdigit():
+        return float(value)
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+class RateLimiter:
+    """
+    Thread-safe politeness delay shared by all download workers.
+
+    wait() hands out request start times at least `min_interval` seconds
+    apart, so the delay is only paid before real outbound requests (never
+    after the last one, or for pages skipped from disk). A 429/503 reply
+    pushes the next slot back by its Retry-After, or by an exponential
+    backoff (1s, 2s, 4s, ... up to `max_backoff`) when the header is absent.
+    """
+
+    def __init__(self, min_interval: float, max_backoff: float = 60.0) -> None:
+        self.min_interval = min_interval
+        self.max_backoff = max_backoff
+        self._next_allowed = 0.0
+        self._backoff = 0.0
+        self._lock = threading.Lock()
+
+    def wait(self) -> None:
+        with self._lock:
+            now = time.monotonic()
+            start = max(now, self._next_allowed)
+            self._next_allowed = start + self.min_interval
+        if start > now:
+            time.sleep(start - now)
+
+    def observe(self, resp: requests.Response) -> None:
+        with self._lock:
+            if resp.status_code not in (429, 503):
+                self._backoff = 0.0
+                return
+            delay = parse_retry_after(resp.headers.get("Retry-After"))
+            if delay is None:
+                self._backoff = min(max(2 * self._backoff, 1.0), self.max_backoff)
+                delay = self._backoff
+            self._next_allowed = max(self._next_allowed, time.monotonic() + delay)
+
+
+# How many times a 429/503 reply is retried (after the limiter's delay)
+THROTTLE_RETRIES = 5
+
+
+def http_get(
+    url: str,
+    headers: Optional[Dict[str, str]] = None,
+    stream: bool = False,
+    limiter: Optional[RateLimiter] = None,
+) -> Optional[requests.Response]:
+    """
+    GET a URL on the shared session; None on request errors or unexpected status.
+
+    A 429/503 reply is fed to the limiter (which pushes the next request
+    slot back by Retry-After or an exponential backoff) and the GET is
+    retried, up to THROTTLE_RETRIES times. Without a shared limiter a
+    private one is used, so one-off fetches still back off.
+    """
+    if limiter is None:
+        limiter = RateLimiter(0.0)
+    for attempt in range(THROTTLE_RETRIES + 1):
+        limiter.wait()
+        try:
+            resp = SESSION.get(url, headers=headers, timeout=30, stream=stream)
+        except requests.RequestException as e:
+            print(f"[ERROR] Request failed for {url}: {e}")
+            return None
+        limiter.observe(resp)
+        if resp.status_code not in (429, 503) or attempt == THROTTLE_RETRIES:
+            break
+        resp.close()
+    if resp.status_code not in (200, 304):
+        print(f"[WARN] got status {resp.status_code} for {url}")
+        resp.close()
+        return None
+    return resp
+
+
+def fetch_html(url: str, limiter: Optional[RateLimiter] = None) -> Optional[bytes]:
+    """
+    Fetch HTML from a URL with basic error handling. Returns the raw body:
+    lxml parses bytes directly, so there is no resp.text charset sniffing
+    and decode to a str that the parser would only re-encode.
+    """
+    resp = http_get(url, limiter=limiter)
+    if resp is None:
+        return None
+    return resp.content
@@ -0,0 +1,53 @@
+"""
+parse_cache.py
+
+On-disk memo of parsed Alzforum pages, shared by the process_* scripts.
+
+Parsed pages are stored as JSON under processed/parsed_cache/<source>/,
+keyed on the HTML file's mtime + size, the mtimes of the parser module
+and html_utils (so edits to the parser invalidate everything) and the
+index fields passed in.
+"""
+
+from __future__ import annotations
+
+import json
+from pathlib import Path
+
+# The lxml helpers every parser builds on; editing them invalidates all sources.
+_HTML_UTILS_FILE = Path(__file__).with_name("html_utils.py")
+
+
+def page_stamp(parser_file: str, html_path: Path, *index_fields: str) -> list:
+    """Cache key for `html_path` as parsed by the module at `parser_file`."""
+    st = html_path.stat()
+    return [
+        st.st_mtime_ns,
+        st.st_size,
+        Path(parser_file).stat().st_mtime_ns,
+        _HTML_UTILS_FILE.stat().st_mtime_ns,
+        *index_fields,
+    ]
+
+
+def load_cached_parse(cache_path: Path, stamp: list):
+    """Cached parse result for `stamp`, or None on a miss / stale / unreadable entry."""
+    try:
+        with cache_path.open("r", encoding="utf-8") as f:
+            cached = json.load(f)
+    except (OSError, ValueError):
+        return None
+    if cached.get("stamp") != stamp:
+        return None
+    return cached["result"]
+
+
+def save_cached_parse(cache_path: Path, stamp: list, result) -> None:
+    """Best-effort cache write: a failure only costs a re-parse next run."""
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = cache_path.with_name(cache_path.name + ".tmp")
+        tmp.write_text(json.dumps({"stamp": stamp, "result": result}), encoding="utf-8")
+        tmp.replace(cache_path)
+    except OSError as e:
+        print(f"[WARN] Could not write parse cache {cache_path}: {e}")
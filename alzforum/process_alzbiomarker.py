@@ -1,13 +1,18 @@
 from __future__ import annotations
 
+import os
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 from typing import List, Dict, Tuple, Optional
 
+import lxml.html
 import pandas as pd
-from bs4 import BeautifulSoup
 from urllib.parse import urljoin
 
+from .html_utils import has_class, node_text
+
 # -------------------------------------------------------------------
 # Paths (assume you run this from project_root/alzforum)
 # -------------------------------------------------------------------
@@ -18,6 +23,18 @@ PROCESSED_DIR = ALZFORUM_ROOT / "processed"
 
 BASE_URL = "https://www.alzforum.org"
 
+_NONALNUM_RE = re.compile(r"[^a-z0-9]+")
+_MULTI_UNDERSCORE_RE = re.compile(r"_+")
+_ANALYTE_RE = re.compile(r"^(.*?)(?:\s*\((.+)\))?$")
+
+# (pattern, analyte_class) in priority order: first pattern found in the name wins
+_ANALYTE_CLASS_RULES = (
+    (re.compile(r"abeta|aβ|amyloid"), "amyloid"),
+    (re.compile(r"tau"), "tau"),
+    (re.compile(r"nfl|neurofilament|nf-l"), "neurodegeneration"),
+    (re.compile(r"gfap|mcp|s100|trem|ykl"), "inflammation"),
+)
+
 
 # -------------------------------------------------------------------
 # Small helpers
@@ -34,33 +51,7 @@ def clean_text(text: str | None) -> str:
     return " ".join(text.replace("\xa0", " ").split())
 
 
-def parse_int(value: str | None) -> Optional[int]:
-    if value is None:
-        return None
-    value = clean_text(value)
-    if value in ("", "-"):
-        return None
-    try:
-        return int(value)
-    except ValueError:
-        return None
-
-
-def parse_float(value: str | None) -> Optional[float]:
-    if value is None:
-        return None
-    value = clean_text(value)
-    if value in ("", "-"):
-        return None
-    # Treat things like "<0.0001" as 0.0001 (lower bound)
-    if value.startswith("<"):
-        value = value[1:]
-    try:
-        return float(value)
-    except ValueError:
-        return None
-
-
+@lru_cache(maxsize=4096)
 def make_biomarker_key(analyte_label: str) -> str:
     """
     Turn strings like 'Aβ42 (CSF)' or 'albumin ratio' into a stable ID:
@@ -73,18 +64,19 @@ def make_biomarker_key(analyte_label: str) -> str:
     # remove parentheses but keep contents
     text = text.replace("(", "_").replace(")", "")
     # replace non-alphanum with underscore
-    text = re.sub(r"[^a-z0-9]+", "_", text)
-    text = re.sub(r"_+", "_", text).strip("_")
+    text = _NONALNUM_RE.sub("_", text)
+    text = _MULTI_UNDERSCORE_RE.sub("_", text).strip("_")
     return text or "unknown"
 
 
+@lru_cache(maxsize=4096)
 def split_analyte_and_fluid(analyte_label: str) -> Tuple[str, Optional[str]]:
     """
     'Aβ42 (CSF)'            -> ('Aβ42', 'CSF')
     'Aβ40 (Plasma/Serum)'   -> ('Aβ40', 'Plasma/Serum')
     'albumin ratio'         -> ('albumin ratio', None)
     """
-    m = re.match(r"^(.*?)(?:\s*\((.+)\))?$", analyte_label.strip())
+    m = _ANALYTE_RE.match(analyte_label.strip())
     if not m:
         return analyte_label.strip(), None
     core = m.group(1).strip()
@@ -92,20 +84,16 @@ def split_analyte_and_fluid(analyte_label: str) -> Tuple[str, Optional[str]]:
     return core, fluid
 
 
+@lru_cache(maxsize=4096)
 def classify_analyte(core_name: str) -> str:
     """
     Very lightweight heuristic to assign analyte_class.
     This is *not* perfect; we can refine later.
     """
     name = core_name.lower()
-    if any(tok in name for tok in ["abeta", "aβ", "amyloid"]):
-        return "amyloid"
-    if "tau" in name:
-        return "tau"
-    if any(tok in name for tok in ["nfl", "neurofilament", "nf-l"]):
-        return "neurodegeneration"
-    if any(tok in name for tok in ["gfap", "mcp", "s100", "trem", "ykl"]):
-        return "inflammation"
+    for pattern, analyte_class in _ANALYTE_CLASS_RULES:
+        if pattern.search(name):
+            return analyte_class
     return "other"
 
 
@@ -114,11 +102,10 @@ def extract_intro(article) -> str:
     Grab the paragraphs at the top of the article, before the first table.
     """
     paras: List[str] = []
-    for child in article.children:
-        name = getattr(child, "name", None)
-        if name == "p":
-            paras.append(clean_text(child.get_text(" ", strip=True)))
-        elif name == "table":
+    for child in article:
+        if child.tag == "p":
+            paras.append(clean_text(node_text(child)))
+        elif child.tag == "table":
             break
     return "\n\n".join(p for p in paras if p)
 
@@ -127,32 +114,73 @@ def extract_intro(article) -> str:
 # Parsers for the two big tables
 # -------------------------------------------------------------------
 
+# Column order of alzbiomarker_effects.csv. Rows are accumulated column-wise
+# (one list per column) and handed to pandas as a dict of lists; the parsed
+# numeric columns are derived from their *_raw columns afterwards, in one
+# vectorised pass (see build_effects_table).
+EFFECT_COLUMNS = (
+    "biomarker_page_id",
+    "page_name",
+    "source_url",
+    "section",
+    "comparison",
+    "biomarker_key",
+    "analyte_label",
+    "analyte_core",
+    "fluid",
+    "analyte_class",
+    "version",
+    "n_raw",
+    "effect_size_raw",
+    "p_value_raw",
+    "n",
+    "effect_size",
+    "p_value",
+    "meta_text",
+    "meta_urls",
+)
+
+PARSED_EFFECT_COLUMNS = ("n", "effect_size", "p_value")
+
+
+def new_effect_columns() -> Dict[str, List]:
+    """Empty column lists for the scraped (non-parsed) effects columns, in EFFECT_COLUMNS order."""
+    return {col: [] for col in EFFECT_COLUMNS if col not in PARSED_EFFECT_COLUMNS}
+
+
+def append_effect_row(cols: Dict[str, List], *values) -> None:
+    """Append one effects row, given in new_effect_columns() order, to the column lists."""
+    for column, value in zip(cols.values(), values):
+        column.append(value)
+
+
 def parse_main_versions_table(
     table,
     biomarker_page_id: str,
     page_name: str,
     url: str,
-) -> List[Dict]:
+    cols: Dict[str, List],
+) -> None:
     """
-    Parse the first big table (AD vs CTRL, MCI-AD vs MCI-Stable).
+    Parse the first big table (AD vs CTRL, MCI-AD vs MCI-Stable),
+    appending one effects row per (biomarker, version) to `cols`.
 
     Layout per data row:
         biomarker | n(1.x) | eff(1.x) | p(1.x) | n(2.x) | eff(2.x) | p(2.x)
                   | n(3.0) | eff(3.0) | p(3.0) | meta links
     """
-    rows: List[Dict] = []
-    tbody = table.find("tbody")
-    if not tbody:
-        return rows
+    tbodies = table.xpath(".//tbody")
+    if not tbodies:
+        return
 
     current_comparison: Optional[str] = None
 
-    for tr in tbody.find_all("tr"):
-        tds = tr.find_all("td")
+    for tr in tbodies[0].xpath(".//tr"):
+        tds = tr.xpath(".//td")
         if not tds:
             continue
 
-        cell_texts = [clean_text(td.get_text(" ", strip=True)) for td in tds]
+        cell_texts = [clean_text(node_text(td)) for td in tds]
 
         # Header row for a comparison group, e.g. "AD vs CTRL"
         if len(cell_texts) >= 2 and cell_texts[1].startswith("#"):
@@ -170,8 +198,8 @@ def parse_main_versions_table(
             return cell_texts[idx] if idx < len(cell_texts) else ""
 
         meta_td = tds[-1]
-        meta_text = clean_text(meta_td.get_text(" ", strip=True))
-        meta_links = [urljoin(BASE_URL, a["href"]) for a in meta_td.find_all("a", href=True)]
+        meta_text = clean_text(node_text(meta_td))
+        meta_links = [urljoin(BASE_URL, href) for href in meta_td.xpath(".//a/@href")]
 
         # Fixed order: v1.x, v2.x, v3.0
         versions = [
@@ -181,64 +209,56 @@ def parse_main_versions_table(
         ]
 
         for version_label, n_raw, eff_raw, p_raw in versions:
-            if (
-                clean_text(n_raw) in ("", "-")
-                and clean_text(eff_raw) in ("", "-")
-                and clean_text(p_raw) in ("", "-")
-            ):
+            # cells are already whitespace-normalised in cell_texts
+            if n_raw in ("", "-") and eff_raw in ("", "-") and p_raw in ("", "-"):
                 continue  # no information for this version
 
             core_name, fluid = split_analyte_and_fluid(analyte_label)
 
-            rows.append(
-                {
-                    "biomarker_page_id": biomarker_page_id,
-                    "page_name": page_name,
-                    "source_url": url,
-                    "section": "version_summary",
-                    "comparison": current_comparison,  # AD vs CTRL / MCI-AD vs MCI-Stable
-                    "biomarker_key": biomarker_key,
-                    "analyte_label": analyte_label,
-                    "analyte_core": core_name,
-                    "fluid": fluid,
-                    "analyte_class": classify_analyte(core_name),
-                    "version": version_label,
-                    "n_raw": clean_text(n_raw),
-                    "effect_size_raw": clean_text(eff_raw),
-                    "p_value_raw": clean_text(p_raw),
-                    "n": parse_int(n_raw),
-                    "effect_size": parse_float(eff_raw),
-                    "p_value": parse_float(p_raw),
-                    "meta_text": meta_text,
-                    "meta_urls": ";".join(meta_links),
-                }
+            append_effect_row(
+                cols,
+                biomarker_page_id,
+                page_name,
+                url,
+                "version_summary",
+                current_comparison,  # AD vs CTRL / MCI-AD vs MCI-Stable
+                biomarker_key,
+                analyte_label,
+                core_name,
+                fluid,
+                classify_analyte(core_name),
+                version_label,
+                n_raw,
+                eff_raw,
+                p_raw,
+                meta_text,
+                ";".join(meta_links),
             )
 
-    return rows
-
 
 def parse_cross_disease_table(
     table,
     biomarker_page_id: str,
     page_name: str,
     url: str,
-) -> List[Dict]:
+    cols: Dict[str, List],
+) -> None:
     """
-    Parse the second big table ("Cross Diseases (non-AD vs AD)").
+    Parse the second big table ("Cross Diseases (non-AD vs AD)"),
+    appending one effects row per biomarker to `cols`.
     """
-    rows: List[Dict] = []
-    tbody = table.find("tbody")
-    if not tbody:
-        return rows
+    tbodies = table.xpath(".//tbody")
+    if not tbodies:
+        return
 
     current_comparison: Optional[str] = None
 
-    for tr in tbody.find_all("tr"):
-        tds = tr.find_all("td")
+    for tr in tbodies[0].xpath(".//tr"):
+        tds = tr.xpath(".//td")
         if not tds:
             continue
 
-        cell_texts = [clean_text(td.get_text(" ", strip=True)) for td in tds]
+        cell_texts = [clean_text(node_text(td)) for td in tds]
 
         # comparison header row, e.g. "ALS vs AD"
         if len(cell_texts) >= 2 and cell_texts[1].startswith("#"):
@@ -254,82 +274,97 @@ def parse_cross_disease_table(
 
         n_raw, eff_raw, p_raw = cell_texts[1], cell_texts[2], cell_texts[3]
         meta_td = tds[-1]
-        meta_text = clean_text(meta_td.get_text(" ", strip=True))
-        meta_links = [urljoin(BASE_URL, a["href"]) for a in meta_td.find_all("a", href=True)]
+        meta_text = clean_text(node_text(meta_td))
+        meta_links = [urljoin(BASE_URL, href) for href in meta_td.xpath(".//a/@href")]
 
         core_name, fluid = split_analyte_and_fluid(analyte_label)
         biomarker_key = make_biomarker_key(analyte_label)
 
-        rows.append(
-            {
-                "biomarker_page_id": biomarker_page_id,
-                "page_name": page_name,
-                "source_url": url,
-                "section": "cross_diseases",
-                "comparison": current_comparison,  # e.g. ALS vs AD, CTRL vs AD
-                "biomarker_key": biomarker_key,
-                "analyte_label": analyte_label,
-                "analyte_core": core_name,
-                "fluid": fluid,
-                "analyte_class": classify_analyte(core_name),
-                "version": "3.0",  # cross-disease table only has v3.0 columns
-                "n_raw": n_raw,
-                "effect_size_raw": eff_raw,
-                "p_value_raw": p_raw,
-                "n": parse_int(n_raw),
-                "effect_size": parse_float(eff_raw),
-                "p_value": parse_float(p_raw),
-                "meta_text": meta_text,
-                "meta_urls": ";".join(meta_links),
-            }
+        append_effect_row(
+            cols,
+            biomarker_page_id,
+            page_name,
+            url,
+            "cross_diseases",
+            current_comparison,  # e.g. ALS vs AD, CTRL vs AD
+            biomarker_key,
+            analyte_label,
+            core_name,
+            fluid,
+            classify_analyte(core_name),
+            "3.0",  # cross-disease table only has v3.0 columns
+            n_raw,
+            eff_raw,
+            p_raw,
+            meta_text,
+            ";".join(meta_links),
         )
 
-    return rows
-
 
 def parse_versioning_history(
     html: str,
     biomarker_page_id: str,
     page_name: str,
     url: str,
-) -> Tuple[Dict, List[Dict]]:
+) -> Tuple[Dict, Dict[str, List]]:
     """
     Parse the whole 'Versioning History' page into:
       - page-level metadata (title, intro text)
-      - row-level effect-size summaries from both tables
+      - row-level effect-size summaries from both tables, as column lists
     """
-    soup = BeautifulSoup(html, "lxml")
-    article = soup.find("article", id="article")
-    if article is None:
+    root = lxml.html.fromstring(html)
+    articles = root.xpath('//article[@id="article"]')
+    if not articles:
         raise ValueError("Could not find main <article id='article'> content")
+    article = articles[0]
 
-    title_el = article.find("h1", class_="page-title")
-    subtitle_el = article.find("h2", class_="pane-subtitle")
+    title_els = article.xpath(has_class("h1", "page-title"))
+    subtitle_els = article.xpath(has_class("h2", "pane-subtitle"))
 
     page_meta = {
         "biomarker_page_id": biomarker_page_id,
         "name": page_name,
         "source_url": url,
-        "page_title": clean_text(title_el.get_text(strip=True)) if title_el else "",
-        "page_subtitle": clean_text(subtitle_el.get_text(strip=True)) if subtitle_el else "",
+        "page_title": clean_text(node_text(title_els[0], "")) if title_els else "",
+        "page_subtitle": clean_text(node_text(subtitle_els[0], "")) if subtitle_els else "",
         "intro_text": extract_intro(article),
     }
 
-    tables = article.find_all("table")
-    all_rows: List[Dict] = []
+    tables = article.xpath(".//table")
+    cols = new_effect_columns()
 
     if len(tables) >= 1:
-        all_rows.extend(parse_main_versions_table(tables[0], biomarker_page_id, page_name, url))
+        parse_main_versions_table(tables[0], biomarker_page_id, page_name, url, cols)
     if len(tables) >= 2:
-        all_rows.extend(parse_cross_disease_table(tables[1], biomarker_page_id, page_name, url))
+        parse_cross_disease_table(tables[1], biomarker_page_id, page_name, url, cols)
 
-    return page_meta, all_rows
+    return page_meta, cols
 
 
 # -------------------------------------------------------------------
 # Top-level processing
 # -------------------------------------------------------------------
 
+def build_effects_table(cols: Dict[str, List]) -> pd.DataFrame:
+    """
+    Turn the scraped effects column lists into the long effects table,
+    parsing n / effect_size / p_value from their (already cleaned) *_raw
+    columns with vectorised pandas ops:
+      - n: plain integers only, anything else -> <NA> (nullable Int64)
+      - effect_size / p_value: floats; "<0.0001" is read as 0.0001
+        (lower bound); "", "-" and other junk -> NaN
+    """
+    df = pd.DataFrame(cols)
+
+    n_raw = df["n_raw"].astype(str)
+    df["n"] = pd.to_numeric(n_raw.where(n_raw.str.fullmatch(r"[+-]?\d+")), errors="coerce").astype("Int64")
+    for col in ("effect_size", "p_value"):
+        raw = df[f"{col}_raw"].astype(str).str.replace(r"^<", "", regex=True)
+        df[col] = pd.to_numeric(raw, errors="coerce")
+
+    return df[list(EFFECT_COLUMNS)]
+
+
 def build_biomarker_table(effects_df: pd.DataFrame) -> pd.DataFrame:
     """
     Collapse the long effects table down to one row per biomarker_key,
@@ -355,7 +390,19 @@ def build_biomarker_table(effects_df: pd.DataFrame) -> pd.DataFrame:
     return grp
 
 
-def process_alzbiomarker() -> None:
+def _parse_one(task: Tuple[str, str, str, str]) -> Tuple[Dict, Dict[str, List]]:
+    """
+    Process-pool worker: read + parse one versioning page.
+
+    Only the (path, id, name, url) strings cross the pickle boundary; the
+    worker reads the HTML itself.
+    """
+    html_path, biomarker_page_id, name, url = task
+    html = read_html(Path(html_path))
+    return parse_versioning_history(html, biomarker_page_id, name, url)
+
+
+def process_alzbiomarker(max_workers: Optional[int] = None) -> None:
     """
     Main entry point:
       - reads processed/alzbiomarker_index.csv
@@ -364,6 +411,9 @@ def process_alzbiomarker() -> None:
           processed/alzbiomarker_pages.csv
           processed/alzbiomarker_effects.csv
           processed/alzbiomarker_biomarkers.csv
+
+    Pages are parsed in a process pool (`max_workers`, default os.cpu_count())
+    when there is more than one; a single page is parsed in-process.
     """
     index_csv = PROCESSED_DIR / "alzbiomarker_index.csv"
     if not index_csv.exists():
@@ -371,27 +421,35 @@ def process_alzbiomarker() -> None:
 
     index_df = pd.read_csv(index_csv)
 
-    page_meta_rows: List[Dict] = []
-    effects_rows: List[Dict] = []
-
-    for _, row in index_df.iterrows():
-        biomarker_page_id = str(row["biomarker_id"])  # "versioning_history"
-        url = row["url"]
-        name = row["name"]
+    tasks: List[Tuple[str, str, str, str]] = []
+    for row in index_df.itertuples(index=False):
+        biomarker_page_id = str(row.biomarker_id)  # "versioning_history"
+        url = row.url
+        name = row.name
 
         html_path = RAW_HTML_DIR / f"{biomarker_page_id}.html"
         if not html_path.exists():
             print(f"[WARN] HTML file not found for {biomarker_page_id} at {html_path}, skipping.")
             continue
 
-        html = read_html(html_path)
-        page_meta, rows = parse_versioning_history(html, biomarker_page_id, name, url)
+        tasks.append((str(html_path), biomarker_page_id, name, url))
+
+    if len(tasks) > 1:
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as ex:
+            results = list(ex.map(_parse_one, tasks, chunksize=8))
+    else:
+        results = [_parse_one(task) for task in tasks]
 
+    page_meta_rows: List[Dict] = []
+    effects_cols = new_effect_columns()
+    for page_meta, cols in results:
         page_meta_rows.append(page_meta)
-        effects_rows.extend(rows)
+        for col, values in cols.items():
+            effects_cols[col].extend(values)
 
     pages_df = pd.DataFrame(page_meta_rows)
-    effects_df = pd.DataFrame(effects_rows)
+    effects_df = build_effects_table(effects_cols)
 
     # Build biomarker-level table from long effects table
     biomarkers_df = build_biomarker_table(effects_df)
@@ -12,12 +12,22 @@ This script is intentionally conservative and heuristic-based.
 We can refine category / section detection later if needed.
 """
 
+from __future__ import annotations
+
 import csv
-from dataclasses import dataclass, asdict
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, fields
+from operator import attrgetter
 from pathlib import Path
-from typing import List, Tuple, Optional
+from typing import Iterator, List, Tuple, Optional
+
+import lxml.html
+from lxml import etree
 
-from bs4 import BeautifulSoup
+from .html_utils import HTML_PARSER, has_class, node_text
+from .parse_cache import load_cached_parse, page_stamp, save_cached_parse
 
 # --------------------------
 # PATHS
@@ -36,7 +46,7 @@ ALZPEDIA_SECTIONS_OUT = PROCESSED_DIR / "alzpedia_sections.csv"
 # DATA MODELS
 # --------------------------
 
-@dataclass
+@dataclass(slots=True)
 class AlzPediaEntity:
     entity_id: str
     name: str
@@ -50,7 +60,7 @@ class AlzPediaEntity:
     has_therapeutics_section: bool
 
 
-@dataclass
+@dataclass(slots=True)
 class AlzPediaSection:
     entity_id: str
     section_name: str        # normalized identifier (e.g. "overview")
@@ -70,19 +80,48 @@ def clean_text(text: Optional[str]) -> str:
     return " ".join(text.split())
 
 
+# Compiled once: every lookup the parser makes, each scoped to the subtree
+# it is evaluated on (page title, synonyms block, div.primary sections).
+_HEADINGS_XPATH = ".//*[self::h1 or self::h2 or self::h3]"
+_HEADINGS = etree.XPath(_HEADINGS_XPATH)
+_PANE_TITLE_HEADINGS = etree.XPath(
+    _HEADINGS_XPATH + "[contains(concat(' ', normalize-space(@class), ' '), ' pane-title ')]"
+)
+_ENTRY_TITLES = etree.XPath(has_class("h1", "entry-title"))
+_SYNONYM_BLOCKS = etree.XPath(has_class("div", "intro-text-synonyms"))
+_SNAPSHOT_PARAS = etree.XPath(has_class("p", "snapshot"))
+_PARAS = etree.XPath(".//p")
+_PRIMARY_DIVS = etree.XPath(has_class("div", "primary"))
+_CHILD_SECTIONS = etree.XPath("./section")
+_SECTIONS = etree.XPath(".//section")
+# Section body text: like node_text, but skipping heading text as well
+_SECTION_TEXT_NODES = etree.XPath(
+    "descendant::text()[not(ancestor::h1 or ancestor::h2 or ancestor::h3"
+    " or ancestor::script or ancestor::style)]"
+)
+
+# Keyword (matched in a section's "<id> <title>", lowercased) -> presence flag.
+# One alternation regex finds them all in a single scan of the string.
+_PRESENCE_KEYWORDS = {
+    "function": "function",
+    "patholog": "pathology",
+    "genetic": "genetics",
+    "therapeutic": "therapeutics",
+}
+_PRESENCE_RE = re.compile("|".join(map(re.escape, _PRESENCE_KEYWORDS)))
+
+
 def guess_category(name: str, synonyms: str, overview_text: str) -> str:
     """
     Very simple heuristic for now.
     Most AlzPedia entries we pulled are genes/proteins/pathology.
     We'll tag them as 'protein_or_gene' and refine later if needed.
     """
-    _ = " ".join([name or "", synonyms or "", overview_text or ""]).lower()
-
     # You could add smarter logic here later (e.g. look for 'gene', 'protein', 'pathology')
     return "protein_or_gene"
 
 
-def extract_synonyms(soup: BeautifulSoup) -> str:
+def extract_synonyms(root) -> str:
     """
     Extract the 'Synonyms' line from the intro-text-synonyms block, if present.
     Example HTML:
@@ -90,15 +129,15 @@ def extract_synonyms(soup: BeautifulSoup) -> str:
         <p class="snapshot"><strong>Synonyms: </strong>ADAM-10, AD10, ...</p>
       </div>
     """
-    block = soup.find("div", class_="intro-text-synonyms")
-    if not block:
+    blocks = _SYNONYM_BLOCKS(root)
+    if not blocks:
         return ""
 
-    p = block.find("p", class_="snapshot") or block.find("p")
-    if not p:
+    paras = _SNAPSHOT_PARAS(blocks[0]) or _PARAS(blocks[0])
+    if not paras:
         return ""
 
-    text = p.get_text(" ", strip=True)
+    text = node_text(paras[0])
     # Remove leading "Synonyms:" if present
     if text.lower().startswith("synonyms"):
         # split on ':' once
@@ -109,7 +148,7 @@ def extract_synonyms(soup: BeautifulSoup) -> str:
 
 
 def extract_sections(
-    soup: BeautifulSoup, entity_id: str
+    root, entity_id: str
 ) -> Tuple[List[AlzPediaSection], dict]:
     """
     Extract sections from the main content column.
@@ -120,42 +159,35 @@ def extract_sections(
     """
     sections_out: List[AlzPediaSection] = []
 
-    primary_div = soup.find("div", class_="primary")
-    if not primary_div:
+    primary_divs = _PRIMARY_DIVS(root)
+    if not primary_divs:
         return sections_out, {}
+    primary_div = primary_divs[0]
 
-    sections = primary_div.find_all("section", recursive=False)
+    sections = _CHILD_SECTIONS(primary_div)
     if not sections:
         # Fallback: some pages might nest sections deeper
-        sections = primary_div.find_all("section")
+        sections = _SECTIONS(primary_div)
 
-    section_presence = {
-        "function": False,
-        "pathology": False,
-        "genetics": False,
-        "therapeutics": False,
-    }
+    section_presence = dict.fromkeys(_PRESENCE_KEYWORDS.values(), False)
 
     for order, sec in enumerate(sections, start=1):
         sec_id = (sec.get("id") or "").strip()
         # Title from pane-title heading if present
-        heading = sec.find(["h1", "h2", "h3"], class_="pane-title")
-        if heading is None:
+        headings = _PANE_TITLE_HEADINGS(sec)
+        if not headings:
             # Sometimes the section has no explicit pane-title
-            heading = sec.find(["h1", "h2", "h3"])
+            headings = _HEADINGS(sec)
 
-        if heading:
-            section_title = clean_text(heading.get_text(" ", strip=True))
+        if headings:
+            section_title = clean_text(node_text(headings[0]))
         elif sec_id:
             section_title = sec_id.replace("-", " ").title()
         else:
             section_title = f"Section {order}"
 
-        # Remove headings from text extraction to avoid duplication
-        for h in sec.find_all(["h1", "h2", "h3"]):
-            h.extract()
-
-        text = clean_text(sec.get_text(" ", strip=True))
+        # Section text without the headings (avoids duplicating the title)
+        text = clean_text(" ".join(_SECTION_TEXT_NODES(sec)))
 
         # Normalized name: prefer id if present
         if sec_id:
@@ -174,39 +206,33 @@ def extract_sections(
         )
 
         lower_combo = f"{sec_id} {section_title}".lower()
-        if "function" in lower_combo:
-            section_presence["function"] = True
-        if "patholog" in lower_combo:
-            section_presence["pathology"] = True
-        if "genetic" in lower_combo:
-            section_presence["genetics"] = True
-        if "therapeutic" in lower_combo:
-            section_presence["therapeutics"] = True
+        for keyword in _PRESENCE_RE.findall(lower_combo):
+            section_presence[_PRESENCE_KEYWORDS[keyword]] = True
 
     return sections_out, section_presence
 
 
 def parse_alzpedia_html(
-    html: str, entity_id: str, url: str, index_title: str
+    html: str | bytes, entity_id: str, url: str, index_title: str
 ) -> Tuple[AlzPediaEntity, List[AlzPediaSection]]:
     """
     Parse a single AlzPedia HTML page into:
       - one AlzPediaEntity
       - many AlzPediaSection
     """
-    soup = BeautifulSoup(html, "lxml")
+    root = lxml.html.fromstring(html, parser=HTML_PARSER)
 
     # Name: <h1 class="entry-title">ADAM10</h1>
-    name_el = soup.find("h1", class_="entry-title")
-    if name_el:
-        name = clean_text(name_el.get_text(" ", strip=True))
+    name_els = _ENTRY_TITLES(root)
+    if name_els:
+        name = clean_text(node_text(name_els[0]))
     else:
         name = index_title  # fallback
 
-    synonyms = extract_synonyms(soup)
+    synonyms = extract_synonyms(root)
 
     # Sections & presence flags
-    section_rows, presence_flags = extract_sections(soup, entity_id)
+    section_rows, presence_flags = extract_sections(root, entity_id)
 
     # Short summary: first paragraph of the overview section, if present
     overview_text = ""
@@ -260,45 +286,67 @@ def load_index(path: Path) -> List[dict]:
         return list(reader)
 
 
-def write_entities(rows: List[AlzPediaEntity], path: Path) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if not rows:
-        print("[WARN] No AlzPedia entities parsed; nothing to write.")
-        return
+# CSV columns per row type, and C-level getters returning a row's values
+# as a tuple in that order (no per-row dict, unlike dataclasses.asdict).
+ENTITY_FIELDS = [fld.name for fld in fields(AlzPediaEntity)]
+SECTION_FIELDS = [fld.name for fld in fields(AlzPediaSection)]
+entity_values = attrgetter(*ENTITY_FIELDS)
+section_values = attrgetter(*SECTION_FIELDS)
 
-    fieldnames = list(asdict(rows[0]).keys())
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(asdict(row))
-    print(f"[ALZPEDIA] Wrote {len(rows)} entities to {path}")
 
+def _parse_one(
+    task: Tuple[str, str, str, str]
+) -> Tuple[Optional[AlzPediaEntity], List[AlzPediaSection], Optional[str]]:
+    """
+    Process-pool worker: read + parse one AlzPedia page from disk
+    (or reuse its parse-cache entry if the page is unchanged).
+    Returns (entity, sections, None), or (None, [], error message) on failure.
+    """
+    html_path, entity_id, url, title = task
+    cache_path = PROCESSED_DIR / "parsed_cache" / "alzpedia" / f"{entity_id}.json"
+    try:
+        stamp = page_stamp(__file__, Path(html_path), url, title)
+        cached = load_cached_parse(cache_path, stamp)
+        if cached is not None:
+            entity_row, section_rows = cached
+            return AlzPediaEntity(*entity_row), [AlzPediaSection(*r) for r in section_rows], None
+
+        html = Path(html_path).read_bytes()
+        entity, sections = parse_alzpedia_html(html, entity_id, url, title)
+    except Exception as e:
+        return None, [], str(e)
+
+    save_cached_parse(cache_path, stamp, [entity_values(entity), [section_values(sec) for sec in sections]])
+    return entity, sections, None
+
+
+def iter_parsed(
+    tasks: List[Tuple[str, str, str, str]], max_workers: Optional[int] = None
+) -> Iterator[Tuple[Optional[AlzPediaEntity], List[AlzPediaSection], Optional[str]]]:
+    """
+    Yield _parse_one results in task order as they become available.
 
-def write_sections(rows: List[AlzPediaSection], path: Path) -> None:
-    path.parent.mkdir(parents=True, exist_ok=True)
-    if not rows:
-        print("[WARN] No AlzPedia sections parsed; nothing to write.")
+    Pages are independent, so they are parsed across a process pool
+    (max_workers defaults to os.cpu_count()); a single page is parsed
+    in-process. Workers read the HTML from disk themselves, so only paths
+    and parsed rows are pickled.
+    """
+    if len(tasks) <= 1:
+        yield from map(_parse_one, tasks)
         return
 
-    fieldnames = list(asdict(rows[0]).keys())
-    with path.open("w", newline="", encoding="utf-8") as f:
-        writer = csv.DictWriter(f, fieldnames=fieldnames)
-        writer.writeheader()
-        for row in rows:
-            writer.writerow(asdict(row))
-    print(f"[ALZPEDIA] Wrote {len(rows)} sections to {path}")
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as ex:
+        yield from ex.map(_parse_one, tasks, chunksize=16)
 
 
-def main():
+def main(max_workers: Optional[int] = None):
     print("=== Alzheimer’s KG – Process AlzPedia ===")
 
     index_rows = load_index(ALZPEDIA_INDEX_PATH)
     print(f"[ALZPEDIA] Loaded {len(index_rows)} index rows from {ALZPEDIA_INDEX_PATH}")
 
-    all_entities: List[AlzPediaEntity] = []
-    all_sections: List[AlzPediaSection] = []
-
+    tasks: List[Tuple[str, str, str, str]] = []
     for row in index_rows:
         entity_id = row["entity_id"]
         url = row.get("url", "")
@@ -309,19 +357,39 @@ def main():
             print(f"[ALZPEDIA] WARNING: HTML file not found for {entity_id}: {html_path}")
             continue
 
-        html = html_path.read_text(encoding="utf-8")
-        try:
-            entity, sections = parse_alzpedia_html(html, entity_id, url, title)
-            all_entities.append(entity)
-            all_sections.extend(sections)
-        except Exception as e:
-            print(f"[ALZPEDIA] ERROR parsing {entity_id}: {e}")
-
-    write_entities(all_entities, ALZPEDIA_ENTITIES_OUT)
-    write_sections(all_sections, ALZPEDIA_SECTIONS_OUT)
+        tasks.append((str(html_path), entity_id, url, title))
+
+    # Rows are streamed to both CSVs as pages are parsed, so memory does not
+    # grow with the number of pages.
+    n_entities = n_sections = 0
+    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
+    with ALZPEDIA_ENTITIES_OUT.open("w", newline="", encoding="utf-8") as ef, \
+            ALZPEDIA_SECTIONS_OUT.open("w", newline="", encoding="utf-8") as sf:
+        entity_writer = csv.writer(ef)
+        section_writer = csv.writer(sf)
+        entity_writer.writerow(ENTITY_FIELDS)
+        section_writer.writerow(SECTION_FIELDS)
+
+        for task, (entity, sections, error) in zip(tasks, iter_parsed(tasks, max_workers)):
+            if error is not None:
+                print(f"[ALZPEDIA] ERROR parsing {task[1]}: {error}")
+                continue
+            entity_writer.writerow(entity_values(entity))
+            section_writer.writerows(map(section_values, sections))
+            n_entities += 1
+            n_sections += len(sections)
+
+    if n_entities:
+        print(f"[ALZPEDIA] Wrote {n_entities} entities to {ALZPEDIA_ENTITIES_OUT}")
+    else:
+        print("[WARN] No AlzPedia entities parsed; wrote header-only CSV.")
+    if n_sections:
+        print(f"[ALZPEDIA] Wrote {n_sections} sections to {ALZPEDIA_SECTIONS_OUT}")
+    else:
+        print("[WARN] No AlzPedia sections parsed; wrote header-only CSV.")
 
     print("=== DONE (AlzPedia) ===")
 
 
 if __name__ == "__main__":
-    main()
\ No newline at end of file
+    main()
@@ -16,14 +16,20 @@ Outputs:
 
 from __future__ import annotations
 
+import csv
+import os
 import re
-import time
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, Iterator, List, Optional, Set, Tuple
 
-import pandas as pd
-import requests
-from bs4 import BeautifulSoup
+import lxml.html
+from lxml import etree
+
+from .html_utils import HTML_PARSER, has_class, node_text
+from .http_utils import RateLimiter, fetch_html
+from .parse_cache import load_cached_parse, page_stamp, save_cached_parse
 
 # -------------------------------------------------------------------
 # Paths
@@ -41,35 +47,82 @@ BASE_URL = "https://www.alzforum.org"
 # HTTP helpers
 # -------------------------------------------------------------------
 
-DEFAULT_HEADERS = {
-    "User-Agent": (
-        "Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) "
-        "AppleWebKit/537.36 (KHTML, like Gecko) "
-        "Chrome/120.0 Safari/537.36"
-    ),
-    "Accept-Language": "en-US,en;q=0.9",
-}
-
-
-def fetch_html(url: str, sleep_seconds: float = 0.5) -> Optional[str]:
-    try:
-        resp = requests.get(url, headers=DEFAULT_HEADERS, timeout=30)
-        if resp.status_code != 200:
-            print(f"[WARN] got status {resp.status_code} for {url}")
-            return None
-        time.sleep(sleep_seconds)
-        return resp.text
-    except requests.RequestException as e:
-        print(f"[ERROR] Request failed for {url}: {e}")
-        return None
-
-
 def clean_text(text: str | None) -> str:
     if text is None:
         return ""
     return " ".join(text.replace("\xa0", " ").split())
 
 
+# Compiled once and evaluated on the narrowest subtree available (the
+# article, a section, a table row) rather than the whole document.
+_BY_ID = etree.XPath(".//*[@id=$element_id]")
+_ARTICLES = etree.XPath('//article[@id="article"]')
+_MAINS = etree.XPath("//main")
+_HEADINGS = etree.XPath(".//*[self::h1 or self::h2 or self::h3]")
+_TABLES = etree.XPath(".//table")
+_TBODIES = etree.XPath(".//tbody")
+_TIMELINE_SPANS = etree.XPath(has_class("div", "timeline-span"))
+_PAGE_TITLES = etree.XPath(has_class("h1", "page-title"))
+_H1S = etree.XPath(".//h1")
+
+
+def find_by_id(el, element_id: str):
+    """First descendant of `el` with the given id attribute, or None."""
+    found = _BY_ID(el, element_id=element_id)
+    return found[0] if found else None
+
+
+_TIMELINE_RE = re.compile(r"\s*\(timeline\)\s*")
+_TIMELINE_TAIL_RE = re.compile(r"\s*\(timeline\)\s*$")
+_WS_RE = re.compile(r"\s+")
+_BACKGROUND_PREFIX_RE = re.compile(r"^\s*background\s*", re.IGNORECASE)
+_SENT_SPLIT_RE = re.compile(r"\.(\s+|$)")
+_PHASE_RE = re.compile(r"phase\s*(\d)")
+_PHASE_CLASS_RE = re.compile(r"phase-(\d+)")
+
+# Ordered keyword rules (first rule with any keyword in the lowercased text
+# wins), for the Therapy Type -> action_type and FDA status classifiers.
+_ACTION_TYPE_RULES = (
+    (("immunotherapy",), "antibody"),
+    (("rna",), "gene_therapy"),  # also covers "DNA/RNA"
+    (("small molecule",), "small_molecule"),
+    (("dietary", "supplement"), "supplement"),
+    (("procedural", "device"), "device_or_procedure"),
+)
+_STATUS_RULES = (
+    (("approved",), "approved"),
+    (("discontinued", "terminated", "halted", "suspended"), "discontinued"),
+)
+
+# Overview labels recognised by parse_overview_kv_from_text, mapped to
+# their output keys. One pattern captures every (label, value) pair in a
+# single left-to-right scan; each value runs up to the next known label.
+_OVERVIEW_LABEL_KEYS = {
+    "Name:": "name",
+    "Synonyms:": "synonyms",
+    "Therapy Type:": "therapy_type",
+    "Target Type:": "target_type",
+    "Condition(s):": "conditions",
+    "U.S. FDA Status:": "fda_status",
+    "US. FDA Status:": "fda_status",
+    "US FDA Status:": "fda_status",
+    "Company:": "company",
+    "Approved For:": "approved_for",
+}
+_OVERVIEW_LABELS_ALT = "|".join(re.escape(label) for label in _OVERVIEW_LABEL_KEYS)
+_OVERVIEW_KV_RE = re.compile(rf"({_OVERVIEW_LABELS_ALT})\s*(.*?)\s*(?={_OVERVIEW_LABELS_ALT}|$)")
+
+
+def first_matching_rule(text: str, rules) -> Optional[str]:
+    for keywords, label in rules:
+        if any(kw in text for kw in keywords):
+            return label
+    return None
+
+
+# Therapy/target labels repeat across hundreds of pages ("Tau (timeline)",
+# "Amyloid-Related (timeline)", ...), so the label cleaners are memoised.
+@lru_cache(maxsize=4096)
 def strip_timeline_suffix(s: Optional[str]) -> Optional[str]:
     """
     Remove trailing '(timeline)' from strings like 'Tau (timeline)'.
@@ -77,36 +130,65 @@ def strip_timeline_suffix(s: Optional[str]) -> Optional[str]:
     """
     if not s:
         return s
-    s = re.sub(r"\s*\(timeline\)\s*", "", s)
+    s = _TIMELINE_RE.sub("", s)
     return s.strip() or None
 
 
-def read_or_download_html(slug: str, url: str) -> Optional[str]:
+def read_or_download_html(
+    slug: str, url: str, limiter: Optional[RateLimiter] = None
+) -> Optional[bytes]:
     """
     Check raw_html/therapeutic_pages/<slug>.html;
     if missing, download from url.
     """
     path = THERAPEUTIC_PAGES_DIR / f"{slug}.html"
     if path.exists():
-        return path.read_text(encoding="utf-8")
+        return path.read_bytes()
 
-    html = fetch_html(url)
+    html = fetch_html(url, limiter=limiter)
     if html is None:
         return None
 
-    path.write_text(html, encoding="utf-8")
+    path.write_bytes(html)
     return html
 
 
+def download_missing_pages(
+    pages: List[Tuple[str, str]],
+    concurrency: int = 8,
+    sleep_seconds: float = 0.5,
+) -> Set[str]:
+    """
+    Download uncached (slug, url) pages on a small thread pool sharing
+    http_utils.SESSION; returns the slugs that could not be fetched.
+
+    Request starts stay `sleep_seconds` apart (at most 1/sleep_seconds
+    req/s, as when pages were fetched one by one); the workers only
+    overlap the network latency of in-flight requests.
+    """
+    if not pages:
+        return set()
+
+    limiter = RateLimiter(sleep_seconds)
+    failed: Set[str] = set()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {
+            pool.submit(read_or_download_html, slug, url, limiter): slug
+            for slug, url in pages
+        }
+        for fut in as_completed(futures):
+            if fut.result() is None:
+                failed.add(futures[fut])
+    return failed
+
+
 # -------------------------------------------------------------------
 # Parsing helpers
 # -------------------------------------------------------------------
 
-def find_article(soup: BeautifulSoup):
-    article = soup.find("article", id="article")
-    if article is None:
-        article = soup.find("main") or soup
-    return article
+def find_article(root):
+    found = _ARTICLES(root) or _MAINS(root)
+    return found[0] if found else root
 
 
 def find_section_block(article, section_keywords: List[str]) -> Optional[str]:
@@ -114,10 +196,10 @@ def find_section_block(article, section_keywords: List[str]) -> Optional[str]:
     Legacy fallback: find first H1/H2/H3 whose text contains any keyword,
     then concatenate text of siblings until next H1/H2/H3.
     """
-    headings = article.find_all(["h1", "h2", "h3"])
+    headings = _HEADINGS(article)
     target_heading = None
     for h in headings:
-        txt = h.get_text(strip=True).lower()
+        txt = node_text(h, "").lower()
         if any(kw.lower() in txt for kw in section_keywords):
             target_heading = h
             break
@@ -126,37 +208,49 @@ def find_section_block(article, section_keywords: List[str]) -> Optional[str]:
         return None
 
     chunks: List[str] = []
-    for sib in target_heading.next_siblings:
-        name = getattr(sib, "name", None)
-        if name in ("h1", "h2", "h3"):
+    for sib in target_heading.itersiblings():
+        if sib.tag in ("h1", "h2", "h3"):
             break
-        if name in ("p", "ul", "ol", "div"):
-            chunks.append(clean_text(sib.get_text(" ", strip=True)))
+        if sib.tag in ("p", "ul", "ol", "div"):
+            chunks.append(clean_text(node_text(sib)))
 
     return "\n\n".join([c for c in chunks if c])
 
 
 def extract_overview_section(article):
-    return article.find(id="overview")
+    return find_by_id(article, "overview")
 
 
 def extract_background_section(article):
     # try explicit mechanism-of-action first
     for sid in ["mechanism-of-action", "mechanism"]:
-        sec = article.find(id=sid)
-        if sec:
+        sec = find_by_id(article, sid)
+        if sec is not None:
             return sec
     # then generic background
-    sec = article.find(id="background")
-    if sec:
-        return sec
-    return None
+    return find_by_id(article, "background")
 
 
 def section_text(section) -> Optional[str]:
     if section is None:
         return None
-    return clean_text(section.get_text(" ", strip=True))
+    return clean_text(node_text(section))
+
+
+# <strong>Label:</strong> text -> overview field key (other labels are snake_cased)
+_OVERVIEW_KEY_MAP = {
+    "Name": "name",
+    "Synonyms": "synonyms",
+    "Therapy Type": "therapy_type",
+    "Target Type": "target_type",
+    "Condition(s)": "conditions",
+    "Conditions": "conditions",
+    "U.S. FDA Status": "fda_status",
+    "US. FDA Status": "fda_status",
+    "US FDA Status": "fda_status",
+    "Company": "company",
+    "Approved For": "approved_for",
+}
 
 
 def parse_overview_kv_from_section(section) -> Dict[str, str]:
@@ -171,42 +265,26 @@ def parse_overview_kv_from_section(section) -> Dict[str, str]:
     """
     kv: Dict[str, str] = {}
 
-    key_map = {
-        "Name": "name",
-        "Synonyms": "synonyms",
-        "Therapy Type": "therapy_type",
-        "Target Type": "target_type",
-        "Condition(s)": "conditions",
-        "Conditions": "conditions",
-        "U.S. FDA Status": "fda_status",
-        "US. FDA Status": "fda_status",
-        "US FDA Status": "fda_status",
-        "Company": "company",
-        "Approved For": "approved_for",
-    }
-
-    for strong in section.find_all("strong"):
-        label_raw = clean_text(strong.get_text(" ", strip=True))
+    for strong in section.iter("strong"):
+        label_raw = clean_text(node_text(strong))
         if not label_raw.endswith(":"):
             continue
         label = label_raw[:-1]  # drop trailing ':'
 
-        # collect siblings until <br/> (or end of this block)
-        value_parts: List[str] = []
-        for sib in strong.next_siblings:
-            name = getattr(sib, "name", None)
-            if name == "br":
+        # collect sibling text until <br/> (or end of this block); in lxml
+        # the text between siblings lives on each element's .tail
+        value_parts: List[str] = [strong.tail or ""]
+        for sib in strong.itersiblings():
+            if sib.tag == "br":
                 break
-            if isinstance(sib, str):
-                value_parts.append(sib)
-            else:
-                value_parts.append(sib.get_text(" ", strip=True))
+            value_parts.append(node_text(sib))
+            value_parts.append(sib.tail or "")
 
         value = clean_text(" ".join(value_parts))
         if not value:
             continue
 
-        key = key_map.get(label, label.lower().replace(" ", "_"))
+        key = _OVERVIEW_KEY_MAP.get(label, label.lower().replace(" ", "_"))
         kv[key] = value
 
     return kv
@@ -220,36 +298,15 @@ def parse_overview_kv_from_text(overview_text: str) -> Dict[str, str]:
     if not overview_text:
         return {}
 
-    text = re.sub(r"\s+", " ", overview_text)
-
-    labels_regex = (
-        r"Name:|Synonyms:|Therapy Type:|Target Type:|Condition\(s\):|"
-        r"U\.S\. FDA Status:|US\. FDA Status:|US FDA Status:|Company:|Approved For:"
-    )
+    text = _WS_RE.sub(" ", overview_text)
 
-    def capture(label: str) -> Optional[str]:
-        pattern = rf"{re.escape(label)}\s*(.+?)\s*(?={labels_regex}|$)"
-        m = re.search(pattern, text)
-        if not m:
-            return None
-        return clean_text(m.group(1))
-
-    kv = {
-        "name": capture("Name:"),
-        "synonyms": capture("Synonyms:"),
-        "therapy_type": capture("Therapy Type:"),
-        "target_type": capture("Target Type:"),
-        "conditions": capture("Condition(s):"),
-        "fda_status": (
-            capture("U.S. FDA Status:")
-            or capture("US. FDA Status:")
-            or capture("US FDA Status:")
-        ),
-        "company": capture("Company:"),
-        "approved_for": capture("Approved For:"),
-    }
-
-    return {k: v for k, v in kv.items() if v}
+    # first non-empty occurrence of each field wins
+    kv: Dict[str, str] = {}
+    for m in _OVERVIEW_KV_RE.finditer(text):
+        value = clean_text(m.group(2))
+        if value:
+            kv.setdefault(_OVERVIEW_LABEL_KEYS[m.group(1)], value)
+    return kv
 
 
 def summarise_mechanism(
@@ -265,10 +322,10 @@ def summarise_mechanism(
     raw = mech_text.replace("\n", " ")
 
     # Drop leading "Background" (case-insensitive)
-    raw = re.sub(r"^\s*background\s*", "", raw, flags=re.IGNORECASE)
+    raw = _BACKGROUND_PREFIX_RE.sub("", raw)
 
     # Crude sentence split
-    parts = [p.strip() for p in re.split(r"\.(\s+|$)", raw) if p.strip()]
+    parts = [p.strip() for p in _SENT_SPLIT_RE.split(raw) if p.strip()]
     if not parts:
         return None
 
@@ -290,7 +347,7 @@ def infer_trial_phase_and_status(
     text = fda_status.lower()
 
     phase_nums: List[int] = []
-    for m in re.finditer(r"phase\s*(\d)", text):
+    for m in _PHASE_RE.finditer(text):
         try:
             phase_nums.append(int(m.group(1)))
         except ValueError:
@@ -299,14 +356,9 @@ def infer_trial_phase_and_status(
     trial_phase_max = max(phase_nums) if phase_nums else None
     has_phase3 = trial_phase_max is not None and trial_phase_max >= 3
 
-    if "approved" in text:
-        status = "approved"
-    elif any(w in text for w in ["discontinued", "terminated", "halted", "suspended"]):
-        status = "discontinued"
-    elif phase_nums:
-        status = "ongoing"
-    else:
-        status = "unknown"
+    status = first_matching_rule(text, _STATUS_RULES)
+    if status is None:
+        status = "ongoing" if phase_nums else "unknown"
 
     return trial_phase_max, has_phase3, status
 
@@ -317,27 +369,28 @@ def infer_timeline_stats(article) -> Tuple[Optional[int], Optional[int]]:
       - max phase across trials
       - number of trials with a timeline-span
     """
-    sec = article.find(id="timeline")
-    if not sec:
+    sec = find_by_id(article, "timeline")
+    if sec is None:
         return None, None
 
-    table = sec.find("table")
-    if not table:
+    tables = _TABLES(sec)
+    if not tables:
         return None, None
 
-    tbody = table.find("tbody") or table
+    tbodies = _TBODIES(tables[0])
+    tbody = tbodies[0] if tbodies else tables[0]
     max_phase: Optional[int] = None
     trial_count = 0
 
-    for tr in tbody.find_all("tr"):
-        span_div = tr.find("div", class_="timeline-span")
-        if not span_div:
+    for tr in tbody.iter("tr"):
+        span_divs = _TIMELINE_SPANS(tr)
+        if not span_divs:
             continue
 
         trial_count += 1
-        classes = span_div.get("class", [])
+        classes = (span_divs[0].get("class") or "").split()
         for cl in classes:
-            m = re.match(r"phase-(\d+)", cl)
+            m = _PHASE_CLASS_RE.match(cl)
             if m:
                 phase = int(m.group(1))
                 if max_phase is None or phase > max_phase:
@@ -347,6 +400,12 @@ def infer_timeline_stats(article) -> Tuple[Optional[int], Optional[int]]:
     return max_phase, trial_count or None
 
 
+@lru_cache(maxsize=4096)
+def clean_target_label(t: str) -> str:
+    # remove trailing "(timeline)" and extra spaces
+    return _TIMELINE_TAIL_RE.sub("", t).strip()
+
+
 def explode_target_types(
     therapeutic_id: str,
     target_type_field: Optional[str],
@@ -359,32 +418,16 @@ def explode_target_types(
     if not target_type_field:
         return []
 
-    raw_targets = [t.strip() for t in target_type_field.split(",") if t.strip()]
-
-    def clean_target_label(t: str) -> str:
-        # remove trailing "(timeline)" and extra spaces
-        t = re.sub(r"\s*\(timeline\)\s*$", "", t)
-        return t.strip()
-
-    target_types = [clean_target_label(t) for t in raw_targets if clean_target_label(t)]
+    cleaned = (clean_target_label(t) for t in target_type_field.split(","))
+    target_types = [t for t in cleaned if t]
 
     if not target_types:
         return []
 
-    ther_lower = (therapy_type_field or "").lower()
-
-    if "immunotherapy" in ther_lower:
-        action_type = "antibody"
-    elif "dna/rna" in ther_lower or "rna" in ther_lower:
-        action_type = "gene_therapy"
-    elif "small molecule" in ther_lower:
-        action_type = "small_molecule"
-    elif "dietary" in ther_lower or "supplement" in ther_lower:
-        action_type = "supplement"
-    elif "procedural" in ther_lower or "device" in ther_lower:
-        action_type = "device_or_procedure"
-    else:
-        action_type = None
+    action_type = first_matching_rule((therapy_type_field or "").lower(), _ACTION_TYPE_RULES)
+
+    # the same mechanism summary annotates every target of this therapeutic
+    target_notes = summarise_mechanism(mechanism_text, max_sentences=1) if mechanism_text else None
 
     rows: List[Dict] = []
     for i, t in enumerate(target_types):
@@ -395,11 +438,7 @@ def explode_target_types(
                 "target_kind": "pathway_or_process",
                 "action_type": action_type,
                 "is_primary_target": True if i == 0 else False,
-                "target_notes": summarise_mechanism(
-                    mechanism_text, max_sentences=1
-                )
-                if mechanism_text
-                else None,
+                "target_notes": target_notes,
             }
         )
 
@@ -407,8 +446,8 @@ def explode_target_types(
 
 
 def extract_last_updated(article) -> Optional[str]:
-    for p in article.find_all("p"):
-        txt = clean_text(p.get_text(" ", strip=True))
+    for p in article.iter("p"):
+        txt = clean_text(node_text(p))
         if txt.lower().startswith("last updated:"):
             return txt.split(":", 1)[1].strip()
     return None
@@ -419,13 +458,13 @@ def extract_last_updated(article) -> Optional[str]:
 # -------------------------------------------------------------------
 
 def parse_therapeutic_page(
-    html: str, therapeutic_id: str, url: str
+    html: str | bytes, therapeutic_id: str, url: str
 ) -> Tuple[Dict, List[Dict], List[Dict]]:
-    soup = BeautifulSoup(html, "lxml")
-    article = find_article(soup)
+    root = lxml.html.fromstring(html, parser=HTML_PARSER)
+    article = find_article(root)
 
-    title_el = article.find("h1", class_="page-title") or article.find("h1")
-    page_title = clean_text(title_el.get_text(strip=True)) if title_el else ""
+    title_els = _PAGE_TITLES(article) or _H1S(article)
+    page_title = clean_text(node_text(title_els[0], "")) if title_els else ""
 
     # --- Overview / key-value pairs ---
     overview_section = extract_overview_section(article)
@@ -469,8 +508,8 @@ def parse_therapeutic_page(
     detail_therapy_type_clean = strip_timeline_suffix(raw_therapy_type)
 
     if raw_target_type:
-        parts = [p.strip() for p in raw_target_type.split(",") if p.strip()]
-        clean_parts = [strip_timeline_suffix(p) for p in parts if strip_timeline_suffix(p)]
+        cleaned = (strip_timeline_suffix(p.strip()) for p in raw_target_type.split(","))
+        clean_parts = [p for p in cleaned if p]
         detail_target_type_clean = ", ".join(clean_parts) if clean_parts else None
     else:
         detail_target_type_clean = None
@@ -526,69 +565,152 @@ def parse_therapeutic_page(
 # Top-level pipeline
 # -------------------------------------------------------------------
 
-def process_therapeutic_details() -> None:
+# Column order of the streamed per-therapeutic tables (keys of the dicts
+# built by explode_target_types / parse_therapeutic_page).
+TARGET_COLUMNS = [
+    "therapeutic_id",
+    "target_name",
+    "target_kind",
+    "action_type",
+    "is_primary_target",
+    "target_notes",
+]
+TRIAL_COLUMNS = [
+    "therapeutic_id",
+    "indication",
+    "trial_phase_max",
+    "has_phase3",
+    "status",
+    "trial_count",
+    "notes",
+]
+
+
+def _parse_one(
+    task: Tuple[str, str, str]
+) -> Tuple[Optional[Tuple[Dict, List[Dict], List[Dict]]], Optional[str]]:
+    """
+    Process-pool worker: read + parse one cached therapeutic page
+    (or reuse its parse-cache entry if the page is unchanged).
+    Returns (parse_therapeutic_page result, None), or (None, error message).
+    """
+    html_path, therapeutic_id, url = task
+    cache_path = PROCESSED_DIR / "parsed_cache" / "therapeutic_pages" / f"{therapeutic_id}.json"
+    try:
+        stamp = page_stamp(__file__, Path(html_path), url)
+        cached = load_cached_parse(cache_path, stamp)
+        if cached is not None:
+            return tuple(cached), None
+
+        html = Path(html_path).read_bytes()
+        parsed = parse_therapeutic_page(html, therapeutic_id, url)
+    except Exception as e:
+        return None, str(e)
+
+    save_cached_parse(cache_path, stamp, list(parsed))
+    return parsed, None
+
+
+def iter_parsed(
+    tasks: List[Tuple[str, str, str]], max_workers: Optional[int] = None
+) -> Iterator[Tuple[Optional[Tuple[Dict, List[Dict], List[Dict]]], Optional[str]]]:
+    """
+    Yield _parse_one results in task order as they become available.
+
+    Parsing is CPU-bound and per-page independent, so it runs across a
+    process pool (max_workers defaults to os.cpu_count()); a single page
+    is parsed in-process.
+    """
+    if len(tasks) <= 1:
+        yield from map(_parse_one, tasks)
+        return
+
+    workers = max_workers or os.cpu_count() or 1
+    with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as ex:
+        yield from ex.map(_parse_one, tasks, chunksize=16)
+
+
+def process_therapeutic_details(max_workers: Optional[int] = None) -> None:
     base_entities_path = PROCESSED_DIR / "therapeutics_entities.csv"
     if not base_entities_path.exists():
         raise FileNotFoundError(f"Base entities CSV not found: {base_entities_path}")
 
-    base_df = pd.read_csv(base_entities_path)
-
-    entity_extra_rows: List[Dict] = []
-    all_target_rows: List[Dict] = []
-    all_trial_rows: List[Dict] = []
+    with base_entities_path.open("r", newline="", encoding="utf-8") as f:
+        reader = csv.DictReader(f)
+        base_fields = list(reader.fieldnames or [])
+        base_rows = list(reader)
 
-    for _, row in base_df.iterrows():
-        therapeutic_id = str(row["therapeutic_id"])
-        url = str(row["url"])
+    pages: List[Tuple[str, str]] = [
+        (row["therapeutic_id"], row["url"])
+        for row in base_rows
+        if row["therapeutic_id"] and not row["therapeutic_id"].startswith("?")
+    ]
 
-        if not therapeutic_id or therapeutic_id.startswith("?"):
-            continue
+    # Missing pages are downloaded up front, concurrently but rate-limited,
+    # before any parsing starts.
+    failed = download_missing_pages(
+        [(tid, url) for tid, url in pages if not (THERAPEUTIC_PAGES_DIR / f"{tid}.html").exists()]
+    )
 
-        html = read_or_download_html(therapeutic_id, url)
-        if html is None:
+    tasks: List[Tuple[str, str, str]] = []
+    for therapeutic_id, url in pages:
+        if therapeutic_id in failed:
             print(f"[WARN] Skipping {therapeutic_id}: could not fetch HTML")
             continue
 
-        try:
-            entity_extra, target_rows, trial_rows = parse_therapeutic_page(
-                html, therapeutic_id, url
-            )
-        except Exception as e:
-            print(f"[ERROR] Failed to parse {therapeutic_id}: {e}")
-            continue
-
-        entity_extra_rows.append(entity_extra)
-        all_target_rows.extend(target_rows)
-        all_trial_rows.extend(trial_rows)
+        html_path = THERAPEUTIC_PAGES_DIR / f"{therapeutic_id}.html"
+        tasks.append((str(html_path), therapeutic_id, url))
 
-    extra_df = pd.DataFrame(entity_extra_rows)
-    targets_df = pd.DataFrame(all_target_rows)
-    trials_df = pd.DataFrame(all_trial_rows)
+    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
-    # merge extra fields into base entities
-    if not extra_df.empty:
-        enriched_df = base_df.merge(extra_df, on="therapeutic_id", how="left")
+    # Target and trial rows are streamed straight to CSV as pages are parsed;
+    # only the per-therapeutic extras are kept, keyed for the final join.
+    extra_by_id: Dict[str, Dict] = {}
+    n_targets = n_trials = 0
+    with (PROCESSED_DIR / "therapeutics_targets.csv").open("w", newline="", encoding="utf-8") as tf, \
+            (PROCESSED_DIR / "therapeutics_trials.csv").open("w", newline="", encoding="utf-8") as rf:
+        target_writer = csv.DictWriter(tf, fieldnames=TARGET_COLUMNS, lineterminator="\n")
+        trial_writer = csv.DictWriter(rf, fieldnames=TRIAL_COLUMNS, lineterminator="\n")
+        target_writer.writeheader()
+        trial_writer.writeheader()
+
+        for task, (parsed, error) in zip(tasks, iter_parsed(tasks, max_workers)):
+            if parsed is None:
+                print(f"[ERROR] Failed to parse {task[1]}: {error}")
+                continue
+
+            entity_extra, target_rows, trial_rows = parsed
+            extra_by_id[entity_extra["therapeutic_id"]] = entity_extra
+            target_writer.writerows(target_rows)
+            trial_writer.writerows(trial_rows)
+            n_targets += len(target_rows)
+            n_trials += len(trial_rows)
+
+    # left-join extra fields onto base entities (base rows pass through as-is)
+    enriched_fields = list(base_fields)
+    if extra_by_id:
+        extra_fields = list(next(iter(extra_by_id.values())))
+        enriched_fields += [col for col in extra_fields if col not in base_fields]
     else:
         print("[WARN] No therapeutic detail pages parsed; enriched entities will match base.")
-        enriched_df = base_df.copy()
-
-    PROCESSED_DIR.mkdir(parents=True, exist_ok=True)
 
     enriched_path = PROCESSED_DIR / "therapeutics_entities_enriched.csv"
-    enriched_df.to_csv(enriched_path, index=False)
-    targets_df.to_csv(PROCESSED_DIR / "therapeutics_targets.csv", index=False)
-    trials_df.to_csv(PROCESSED_DIR / "therapeutics_trials.csv", index=False)
+    with enriched_path.open("w", newline="", encoding="utf-8") as f:
+        writer = csv.DictWriter(f, fieldnames=enriched_fields, lineterminator="\n")
+        writer.writeheader()
+        for row in base_rows:
+            writer.writerow({**row, **extra_by_id.get(row["therapeutic_id"], {})})
 
     print(
-        f"[THERAPEUTIC DETAILS] Wrote {len(enriched_df)} enriched entity rows -> {enriched_path.name}"
+        f"[THERAPEUTIC DETAILS] Wrote {len(base_rows)} enriched entity rows -> {enriched_path.name}"
     )
     print(
-        f"[THERAPEUTIC DETAILS] Wrote {len(targets_df)} target rows -> therapeutics_targets.csv"
+        f"[THERAPEUTIC DETAILS] Wrote {n_targets} target rows -> therapeutics_targets.csv"
     )
     print(
-        f"[THERAPEUTIC DETAILS] Wrote {len(trials_df)} trial rows -> therapeutics_trials.csv"
+        f"[THERAPEUTIC DETAILS] Wrote {n_trials} trial rows -> therapeutics_trials.csv"
     )
 
 
 if __name__ == "__main__":
-    process_therapeutic_details()
\ No newline at end of file
+    process_therapeutic_details()
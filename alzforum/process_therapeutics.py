@@ -1,13 +1,18 @@
 from __future__ import annotations
 
-import re
+import os
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
-from typing import List, Dict, Optional
+from typing import List, Dict, Optional, Tuple
 
+import lxml.html
 import pandas as pd
-from bs4 import BeautifulSoup
+from lxml import etree
 from urllib.parse import urljoin
 
+from .html_utils import HTML_PARSER, node_text
+from .parse_cache import load_cached_parse, page_stamp, save_cached_parse
+
 # -------------------------------------------------------------------
 # Paths (assume you run this from project_root/alzforum)
 # -------------------------------------------------------------------
@@ -23,8 +28,10 @@ BASE_URL = "https://www.alzforum.org"
 # Helpers
 # -------------------------------------------------------------------
 
-def read_html(path: Path) -> str:
-    return path.read_text(encoding="utf-8")
+def read_html(path: Path) -> bytes:
+    # Raw bytes: pages are saved as UTF-8, so the parser is told the
+    # encoding up front instead of decoding to str first.
+    return path.read_bytes()
 
 
 def clean_text(text: str | None) -> str:
@@ -33,127 +40,157 @@ def clean_text(text: str | None) -> str:
     return " ".join(text.replace("\xa0", " ").split())
 
 
+# Compiled once. The results table is the first <table> in the first
+# section#results of the first article#article (one evaluation replaces
+# the three step-wise lookups); the rest are scoped to the table / a row.
+_RESULTS_TABLE = etree.XPath(
+    "(((//article[@id='article'])[1]//section[@id='results'])[1]//table)[1]"
+)
+_TBODY_ROWS = etree.XPath("(.//tbody)[1]//tr")
+_ROW_LINKS = etree.XPath("(.//th[@scope='row'])[1]//a[@href]")
+_CELLS = etree.XPath(".//td")
+
+
+def unique_pipe_join_by(keys: pd.Series, values: pd.Series) -> pd.Series:
+    """
+    Vectorised unique_pipe_join over groups: for each key, the distinct
+    non-empty (cleaned) strings in `values`, ' | '-joined in first-seen order.
+    """
+    # .str ops turn non-string cells into NaN, which are then dropped
+    cleaned = (
+        values.astype(object)
+        .str.replace("\xa0", " ", regex=False)
+        .str.split()
+        .str.join(" ")
+    )
+    pairs = pd.DataFrame({"key": keys, "value": cleaned}).dropna()
+    pairs = pairs[pairs["value"] != ""].drop_duplicates()
+    return pairs.groupby("key", sort=False)["value"].agg(" | ".join)
+
+
 def unique_pipe_join(values: pd.Series) -> str:
     """Join non-empty strings with ' | ' preserving first-seen order."""
-    seen = []
-    for v in values:
-        if not isinstance(v, str):
-            continue
-        v = clean_text(v)
-        if not v:
-            continue
-        if v not in seen:
-            seen.append(v)
-    return " | ".join(seen)
+    # dict keys: ordered like a list, but O(1) membership for the dedup
+    cleaned = (clean_text(v) for v in values if isinstance(v, str))
+    return " | ".join(dict.fromkeys(v for v in cleaned if v))
 
 
 # -------------------------------------------------------------------
 # Parsing of search result pages
 # -------------------------------------------------------------------
 
+# Column order of therapeutics_search_results.csv. Rows are accumulated
+# column-wise (one list per column) and handed to pandas as a dict of lists.
+SEARCH_RESULT_COLUMNS = (
+    # context: which search combo produced this row
+    "search_id",
+    "search_name",
+    "search_url",
+    # therapeutic-level info
+    "therapeutic_id",
+    "therapeutic_name",
+    "therapeutic_url",
+    "synonyms",
+    "fda_status",
+    "company",
+    "target_type",
+    "therapy_type",
+    "approved_for",
+)
+
+
+def new_search_columns() -> Dict[str, List]:
+    """Empty column lists, in SEARCH_RESULT_COLUMNS order."""
+    return {col: [] for col in SEARCH_RESULT_COLUMNS}
+
+
 def parse_search_results_table(
     table,
     search_id: str,
     search_name: str,
     page_url: str,
-) -> List[Dict]:
+) -> Dict[str, List]:
     """
-    Parse the Search Results table on a therapeutics search page.
+    Parse the Search Results table on a therapeutics search page into
+    new_search_columns() lists.
 
     Table columns:
       Name | Synonyms | FDA Status | Company | Target Type | Therapy Type | Approved For
     """
-    rows: List[Dict] = []
+    cols = new_search_columns()
     if table is None:
-        return rows
+        return cols
 
-    tbody = table.find("tbody")
-    if not tbody:
-        return rows
-
-    for tr in tbody.find_all("tr"):
+    for tr in _TBODY_ROWS(table):
         # First TH cell contains the Name + detail link
-        th = tr.find("th", scope="row")
-        if th is None:
-            continue
-
-        link = th.find("a", href=True)
-        if not link:
+        links = _ROW_LINKS(tr)
+        if not links:
             continue
-
-        name = clean_text(link.get_text(" ", strip=True))
-        href = link["href"]
-        therapeutic_url = urljoin(BASE_URL, href)
+        link = links[0]
+
+        name = clean_text(node_text(link))
+        href = link.get("href")
+        # site-relative paths (the normal case) just need the host prefix;
+        # urljoin re-parses BASE_URL on every call, so it is the fallback
+        if href.startswith("/") and not href.startswith("//"):
+            therapeutic_url = BASE_URL + href
+        else:
+            therapeutic_url = urljoin(BASE_URL, href)
         # slug from /therapeutics/<slug>
         therapeutic_id = href.rstrip("/").split("/")[-1]
 
         # Remaining columns in fixed order
-        tds = tr.find_all("td")
+        tds = _CELLS(tr)
         # Guard for weird/incomplete rows
         if len(tds) < 6:
             continue
 
-        synonyms = clean_text(tds[0].get_text(" ", strip=True))
-        fda_status = clean_text(tds[1].get_text(" ", strip=True))
-        company = clean_text(tds[2].get_text(" ", strip=True))
-        target_type = clean_text(tds[3].get_text(" ", strip=True))
-        therapy_type = clean_text(tds[4].get_text(" ", strip=True))
-        approved_for = clean_text(tds[5].get_text(" ", strip=True))
-
-        rows.append(
-            {
-                # context: which search combo produced this row
-                "search_id": search_id,
-                "search_name": search_name,
-                "search_url": page_url,
-
-                # therapeutic-level info
-                "therapeutic_id": therapeutic_id,
-                "therapeutic_name": name,
-                "therapeutic_url": therapeutic_url,
-                "synonyms": synonyms,
-                "fda_status": fda_status,
-                "company": company,
-                "target_type": target_type,
-                "therapy_type": therapy_type,
-                "approved_for": approved_for,
-            }
+        synonyms, fda_status, company, target_type, therapy_type, approved_for = (
+            clean_text(node_text(td)) for td in tds[:6]
         )
 
-    return rows
+        row = (
+            search_id,
+            search_name,
+            page_url,
+            therapeutic_id,
+            name,
+            therapeutic_url,
+            synonyms,
+            fda_status,
+            company,
+            target_type,
+            therapy_type,
+            approved_for,
+        )
+        for column, value in zip(cols.values(), row):
+            column.append(value)
+
+    return cols
 
 
 def parse_therapeutics_search_page(
-    html: str,
+    html: str | bytes,
     search_id: str,
     search_name: str,
     page_url: str,
-) -> List[Dict]:
+) -> Dict[str, List]:
     """
     Given a therapeutics *search* page HTML (like the one you showed),
     extract all rows from the Search Results table.
 
-    If the page has no results (no table), this returns an empty list
-    and the caller just moves on.
+    If the page has no results (no table), this returns empty column
+    lists and the caller just moves on.
     """
-    soup = BeautifulSoup(html, "lxml")
-    article = soup.find("article", id="article")
-    if article is None:
-        # Not a standard therapeutics page; ignore (e.g. timeline)
-        return []
-
-    results_section = article.find("section", id="results")
-    if results_section is None:
-        # e.g. timeline / non-search pages
-        return []
-
-    table = results_section.find("table")
-    if table is None:
-        # This is the "0 therapeutics" case: no table, just text.
-        return []
+    root = lxml.html.fromstring(html, parser=HTML_PARSER)
+    tables = _RESULTS_TABLE(root)
+    if not tables:
+        # No article#article (e.g. timeline), no section#results, or the
+        # "0 therapeutics" case: no table, just text.
+        return new_search_columns()
 
     return parse_search_results_table(
-        table=table,
+        table=tables[0],
         search_id=search_id,
         search_name=search_name,
         page_url=page_url,
@@ -202,23 +239,30 @@ def build_therapeutics_entities(search_df: pd.DataFrame) -> pd.DataFrame:
 
     group_cols = ["therapeutic_id"]
 
-    agg_df = (
-        search_df
-        .sort_values(["therapeutic_id", "therapeutic_name"])
-        .groupby(group_cols, as_index=False)
-        .agg(
-            name=("therapeutic_name", "first"),
-            url=("therapeutic_url", "first"),
-            synonyms=("synonyms", unique_pipe_join),
-            fda_statuses=("fda_status", unique_pipe_join),
-            companies=("company", unique_pipe_join),
-            target_types=("target_type", unique_pipe_join),
-            therapy_types=("therapy_type", unique_pipe_join),
-            approved_for=("approved_for", unique_pipe_join),
-            source_search_ids=("search_id", unique_pipe_join),
-        )
+    # No full-frame sort: name/url are the same on every row of a slug, so
+    # "first" in search-page order is enough (groupby still orders the ids),
+    # and the pipe-joined columns keep that first-seen order too
+    agg_df = search_df.groupby(group_cols, as_index=False).agg(
+        name=("therapeutic_name", "first"),
+        url=("therapeutic_url", "first"),
     )
 
+    # Pipe-joined columns: dedup + join per column in pandas rather than a
+    # Python callback per (group, column)
+    pipe_columns = {
+        "synonyms": "synonyms",
+        "fda_statuses": "fda_status",
+        "companies": "company",
+        "target_types": "target_type",
+        "therapy_types": "therapy_type",
+        "approved_for": "approved_for",
+        "source_search_ids": "search_id",
+    }
+    keys = search_df["therapeutic_id"]
+    for out_col, src_col in pipe_columns.items():
+        joined = unique_pipe_join_by(keys, search_df[src_col])
+        agg_df[out_col] = agg_df["therapeutic_id"].map(joined).fillna("")
+
     return agg_df
 
 
@@ -226,7 +270,32 @@ def build_therapeutics_entities(search_df: pd.DataFrame) -> pd.DataFrame:
 # Top-level driver
 # -------------------------------------------------------------------
 
-def process_therapeutics() -> None:
+def _parse_one(task: Tuple[str, str, str, str]) -> Dict[str, List]:
+    """
+    Process-pool worker: read + parse one search page (or reuse its
+    parse-cache entry if the page is unchanged).
+
+    Only the (path, search_id, name, url) strings cross the pickle
+    boundary; the worker reads the HTML itself.
+    """
+    html_path, search_id, name, url = task
+    cache_path = PROCESSED_DIR / "parsed_cache" / "therapeutics" / f"{search_id}.json"
+    stamp = page_stamp(__file__, Path(html_path), name, url)
+    cached = load_cached_parse(cache_path, stamp)
+    if cached is not None:
+        return cached
+
+    cols = parse_therapeutics_search_page(
+        html=read_html(Path(html_path)),
+        search_id=search_id,
+        search_name=name,
+        page_url=url,
+    )
+    save_cached_parse(cache_path, stamp, cols)
+    return cols
+
+
+def process_therapeutics(max_workers: Optional[int] = None) -> None:
     """
     Main entry point for current Therapeutics processing:
 
@@ -240,39 +309,52 @@ def process_therapeutics() -> None:
           (one row per search-results row)
         - processed/therapeutics_entities.csv
           (one row per unique therapeutic slug)
+
+    Pages are parsed in a process pool (`max_workers`, default os.cpu_count())
+    when there is more than one; a single page is parsed in-process.
     """
     index_csv = PROCESSED_DIR / "therapeutics_index.csv"
     if not index_csv.exists():
         raise FileNotFoundError(f"Index CSV not found: {index_csv}")
 
-    index_df = pd.read_csv(index_csv)
+    # Read every cell as text (blank -> ""), so ids/names need no str()
+    # coercion and numeric-looking values keep their exact spelling
+    index_df = pd.read_csv(index_csv, dtype=str, keep_default_na=False)
 
-    all_rows: List[Dict] = []
+    # plain tuples (no per-row Series); "name" is optional in the index
+    index_rows = index_df.reindex(columns=["therapeutic_id", "url", "name"], fill_value="")
 
-    for _, row in index_df.iterrows():
-        search_id = str(row["therapeutic_id"])
-        url = row["url"]
-        name = str(row.get("name", ""))
+    # One directory listing instead of a Path + exists() stat per index row
+    available: Dict[str, str] = {}
+    if RAW_HTML_DIR.is_dir():
+        with os.scandir(RAW_HTML_DIR) as entries:
+            available = {e.name[:-5]: e.path for e in entries if e.name.endswith(".html")}
 
-        html_path = RAW_HTML_DIR / f"{search_id}.html"
-        if not html_path.exists():
-            print(f"[WARN] HTML file not found for search_id={search_id} at {html_path}, skipping.")
+    tasks: List[Tuple[str, str, str, str]] = []
+    for search_id, url, name in index_rows.itertuples(index=False, name=None):
+        html_path = available.get(search_id)
+        if html_path is None:
+            print(f"[WARN] HTML file not found for search_id={search_id} at {RAW_HTML_DIR / f'{search_id}.html'}, skipping.")
             continue
 
-        html = read_html(html_path)
-        rows = parse_therapeutics_search_page(
-            html=html,
-            search_id=search_id,
-            search_name=name,
-            page_url=url,
-        )
+        tasks.append((html_path, search_id, name, url))
+
+    if len(tasks) > 1:
+        workers = max_workers or os.cpu_count() or 1
+        with ProcessPoolExecutor(max_workers=min(workers, len(tasks))) as ex:
+            results = list(ex.map(_parse_one, tasks, chunksize=16))
+    else:
+        results = [_parse_one(task) for task in tasks]
 
-        if not rows:
+    search_cols = new_search_columns()
+    for (_, search_id, _, _), cols in zip(tasks, results):
+        if not cols["search_id"]:
             print(f"[INFO] No search results found on page {search_id} (this is fine for 0-therapeutic combos).")
-        all_rows.extend(rows)
+        for col, values in cols.items():
+            search_cols[col].extend(values)
 
     # Raw search results (long table)
-    search_df = pd.DataFrame(all_rows)
+    search_df = pd.DataFrame(search_cols)
 
     # Aggregated per-therapeutic entity table
     entities_df = build_therapeutics_entities(search_df)
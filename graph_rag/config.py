@@ -27,6 +27,7 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass
+from typing import Final
 
 
 # ---------------------------------------------------------------------
@@ -45,7 +46,7 @@ NEO4J_DB: str = os.getenv("NEO4J_DB", "neo4j")
 # ---------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class LLMConfig:
     """
     Generic LLM configuration.
@@ -65,7 +66,7 @@ class LLMConfig:
     timeout_s: int = 60
 
 
-LLM_CONFIG = LLMConfig(
+LLM_CONFIG: Final = LLMConfig(
     provider=os.getenv("LLM_PROVIDER", "ollama"),
     model=os.getenv("LLM_MODEL", "llama3.2:3b"),
     base_url=os.getenv("OLLAMA_BASE_URL", "http://localhost:11434/api"),
@@ -101,7 +102,7 @@ TOPK_GENES: int = int(os.getenv("GRAPH_RAG_TOPK_GENES", "50"))
 # ---------------------------------------------------------------------
 
 
-@dataclass(frozen=True)
+@dataclass(frozen=True, slots=True, eq=False)
 class AppConfig:
     # Neo4j
     neo4j_uri: str = NEO4J_URI
@@ -126,4 +127,5 @@ class AppConfig:
     max_edges: int = DEFAULT_MAX_EDGES
 
 
-CONFIG = AppConfig()
\ No newline at end of file
+# Built once at import; every field default above is already a plain value.
+CONFIG: Final = AppConfig()
\ No newline at end of file
@@ -9,7 +9,9 @@ This module has two layers:
 
 1) Pure formatters that take Python dict/list structures
    (summarize_biomarkers, summarize_drugs, summarize_phenotypes,
-    summarize_drug_pathways, summarize_genes_proteins).
+    summarize_drug_pathways, summarize_genes_proteins). Each has a
+   *_lines variant returning the (trimmed) list of lines, which the
+   wrappers below splice together and join only once.
 
 2) Small convenience wrappers that talk to the GraphRetriever and
    build **intent-specific** context strings:
@@ -24,11 +26,20 @@ These wrappers are what the router / pipeline should call.
 
 from __future__ import annotations
 
+import weakref
 from collections import defaultdict
-from typing import Dict, List, Tuple, Optional
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from operator import itemgetter
+from typing import TYPE_CHECKING, Dict, Iterable, List, Tuple, Optional
 
 from .config import CONFIG
 
+if TYPE_CHECKING:
+    # Annotation-only: retriever imports this module (and the neo4j driver),
+    # so a runtime import would be circular and slow down the pure formatters.
+    from .retriever import GraphRetriever
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -39,9 +50,36 @@ def _safe_str(x: object) -> str:
     """Return a safe string representation (avoid 'None')."""
     if x is None:
         return ""
+    # most graph properties already come back as str
+    if type(x) is str:
+        return x
     return str(x)
 
 
+def _row_strs(row: Dict[str, object], keys: Tuple[str, ...]) -> List[str]:
+    """_safe_str of several fields of one row, in `keys` order, in a single call."""
+    return ["" if v is None else str(v) for v in map(row.get, keys)]
+
+
+# Common direction spellings (stripped, lower-cased) resolved by one dict
+# lookup; anything else goes through the substring rules below.
+_DIRECTION_EXACT = {
+    "increased": "increased",
+    "up": "increased",
+    "upregulated": "increased",
+    "higher": "increased",
+    "decreased": "decreased",
+    "down": "decreased",
+    "downregulated": "decreased",
+    "lower": "decreased",
+    "no_change": "no_change",
+    "no change": "no_change",
+}
+
+
+# The KG only holds a handful of distinct fluid / direction strings, so the
+# two normalizers below are memoised (None is hashable too).
+@lru_cache(maxsize=128)
 def _normalize_direction(raw: Optional[str]) -> str:
     """
     Normalize direction strings from the KG to a small set:
@@ -50,6 +88,9 @@ def _normalize_direction(raw: Optional[str]) -> str:
     if not raw:
         return "unknown"
     s = raw.strip().lower()
+    exact = _DIRECTION_EXACT.get(s)
+    if exact is not None:
+        return exact
     if "increase" in s or "higher" in s or s in ("up", "upregulated"):
         return "increased"
     if "decrease" in s or "lower" in s or s in ("down", "downregulated"):
@@ -59,6 +100,7 @@ def _normalize_direction(raw: Optional[str]) -> str:
     return s or "unknown"
 
 
+@lru_cache(maxsize=128)
 def _fluid_bucket(fluid: Optional[str]) -> str:
     """
     Bucket fluid names to keep things simple:
@@ -76,140 +118,181 @@ def _fluid_bucket(fluid: Optional[str]) -> str:
     return "Other/unspecified"
 
 
-def _dedupe_preserve_order(items: List[str]) -> List[str]:
-    """Simple stable de-duplication."""
-    seen = set()
-    out: List[str] = []
-    for it in items:
-        if it not in seen:
-            seen.add(it)
-            out.append(it)
-    return out
+def _trim_tail(lines: List[str]) -> List[str]:
+    """
+    Drop trailing blank lines and trailing whitespace in place, so that
+    "\n".join(lines) equals the old "\n".join(lines).rstrip().
+    """
+    while lines and not lines[-1].strip():
+        lines.pop()
+    if lines:
+        lines[-1] = lines[-1].rstrip()
+    return lines
 
 
 # ---------------------------------------------------------------------------
 # Biomarkers
 # ---------------------------------------------------------------------------
 
+# Deterministic order of groups, and display text per normalized direction
+_FLUID_ORDER = ("CSF", "Plasma/Serum", "Other/unspecified")
+_DIRECTION_ORDER = ("decreased", "increased", "no_change", "unknown")
+_HUMAN_DIR = {
+    "decreased": "Decreased",
+    "increased": "Increased",
+    "no_change": "No clear change",
+    "unknown": "Direction unclear",
+}
 
-def summarize_biomarkers(biomarkers: List[Dict[str, object]]) -> str:
-    """
-    Ultra-compact summary of AD biomarkers.
-
-    Input: list of rows as returned by GraphRetriever.get_ad_biomarkers:
 
-        {
-            "biomarker_id": ...,
-            "biomarker_label": ...,
-            "analyte": ...,
-            "analyte_class": ...,
-            "fluid": ...,
-            "direction": ...,
-            "effect_size": ...,
-            "p_value": ...,
-            ...
-        }
+class BiomarkerSummary:
+    """
+    Mergeable biomarker summary: feed rows with update() (or combine two
+    partial summaries with merge()) and format with render_lines()/render().
 
-    Output: structured text grouped by fluid + direction.
+    Its state is just the grouping used for rendering, so rows can be
+    consumed from a paged / streamed query without materialising the list,
+    and merge(S(A), S(B)) renders the same as S(A + B).
     """
-    if not biomarkers:
-        return "No biomarker information was found in the graph.\n"
 
-    # group[(fluid_bucket, direction)] = list of (name, extras_dict)
-    groups: Dict[Tuple[str, str], List[Tuple[str, Dict[str, str]]]] = defaultdict(list)
+    def __init__(self) -> None:
+        # groups[(fluid_bucket, direction)][name] = extras, merged as rows arrive
+        self.groups: Dict[Tuple[str, str], Dict[str, Dict[str, str]]] = defaultdict(dict)
+        self.n_rows = 0
 
-    for row in biomarkers:
-        fluid_bucket = _fluid_bucket(_safe_str(row.get("fluid")))
-        direction = _normalize_direction(_safe_str(row.get("direction")))
+    def update(self, row: Dict[str, object]) -> None:
+        self.n_rows += 1
+        fluid, direction, label, analyte, biomarker_id, analyte_class = _row_strs(
+            row,
+            ("fluid", "direction", "biomarker_label", "analyte", "biomarker_id", "analyte_class"),
+        )
 
         # Choose a display name for the biomarker
-        name = (
-            _safe_str(row.get("biomarker_label"))
-            or _safe_str(row.get("analyte"))
-            or _safe_str(row.get("biomarker_id"))
-        )
+        name = label or analyte or biomarker_id
 
         if not name:
-            continue
+            return
 
         extras = {}
-        analyte_class = _safe_str(row.get("analyte_class"))
         if analyte_class:
             extras["class"] = analyte_class
 
         # effect size and p-value if present
-        effect_size = row.get("effect_size")
+        get = row.get
+        effect_size = get("effect_size")
         if effect_size not in (None, ""):
             extras["effect_size"] = str(effect_size)
 
-        p_value = row.get("p_value")
+        p_value = get("p_value")
         if p_value not in (None, ""):
             extras["p"] = str(p_value)
 
-        groups[(fluid_bucket, direction)].append((name, extras))
+        key = (_fluid_bucket(fluid), _normalize_direction(direction))
+        self._add(self.groups[key], name, extras)
 
-    # Build text sections
-    lines: List[str] = []
-    lines.append("### Biomarkers associated with Alzheimer’s disease")
-    lines.append(
-        "Below is a compact summary of biomarkers grouped by biofluid and "
-        "direction of change in Alzheimer’s disease."
-    )
-    lines.append("")
+    @staticmethod
+    def _add(name_to_extras: Dict[str, Dict[str, str]], name: str, extras: Dict[str, str]) -> None:
+        # Aggregate by name to avoid duplicates
+        merged = name_to_extras.get(name)
+        if merged is None:
+            name_to_extras[name] = extras
+        else:
+            # crude merge: keep first non-empty values
+            for k, v in extras.items():
+                if not merged.get(k):
+                    merged[k] = v
+
+    def merge(self, other: "BiomarkerSummary") -> "BiomarkerSummary":
+        """Fold `other` (rows that came after ours) into this summary."""
+        self.n_rows += other.n_rows
+        for key, other_names in other.groups.items():
+            name_to_extras = self.groups[key]
+            for name, extras in other_names.items():
+                self._add(name_to_extras, name, dict(extras))
+        return self
+
+    def render_lines(self) -> List[str]:
+        if not self.n_rows:
+            return ["No biomarker information was found in the graph."]
+
+        groups = self.groups
+
+        # Build text sections
+        lines: List[str] = []
+        lines.append("### Biomarkers associated with Alzheimer’s disease")
+        lines.append(
+            "Below is a compact summary of biomarkers grouped by biofluid and "
+            "direction of change in Alzheimer’s disease."
+        )
+        lines.append("")
 
-    # Deterministic order of groups
-    fluid_order = ["CSF", "Plasma/Serum", "Other/unspecified"]
-    direction_order = ["decreased", "increased", "no_change", "unknown"]
+        for fluid in _FLUID_ORDER:
+            section_started = False
+            for direction in _DIRECTION_ORDER:
+                key = (fluid, direction)
+                if key not in groups:
+                    continue
+
+                if not section_started:
+                    lines.append(f"#### {fluid}")
+                    section_started = True
+
+                human_dir = _HUMAN_DIR.get(direction) or direction.capitalize()
+
+                lines.append(f"- **{human_dir} in AD**:")
+                # names are unique per group, so the sort never compares extras
+                for biomarker_name, ex in sorted(groups[key].items()):
+                    ex_bits = []
+                    if "class" in ex:
+                        ex_bits.append(ex["class"])
+                    if "effect_size" in ex:
+                        ex_bits.append(f"effect_size={ex['effect_size']}")
+                    if "p" in ex:
+                        ex_bits.append(f"p={ex['p']}")
+                    if ex_bits:
+                        lines.append(f"  • {biomarker_name} ({', '.join(ex_bits)})")
+                    else:
+                        lines.append(f"  • {biomarker_name}")
+                lines.append("")  # blank line between direction groups
+
+            if section_started:
+                lines.append("")  # blank line between fluid sections
+
+        return _trim_tail(lines)
+
+    def render(self) -> str:
+        return "\n".join(self.render_lines()) + "\n"
+
+
+def summarize_biomarkers_lines(biomarkers: Iterable[Dict[str, object]]) -> List[str]:
+    """
+    Ultra-compact summary of AD biomarkers.
 
-    for fluid in fluid_order:
-        section_started = False
-        for direction in direction_order:
-            key = (fluid, direction)
-            if key not in groups:
-                continue
+    Input: list of rows as returned by GraphRetriever.get_ad_biomarkers:
 
-            if not section_started:
-                lines.append(f"#### {fluid}")
-                section_started = True
-
-            human_dir = {
-                "decreased": "Decreased",
-                "increased": "Increased",
-                "no_change": "No clear change",
-                "unknown": "Direction unclear",
-            }.get(direction, direction.capitalize())
-
-            lines.append(f"- **{human_dir} in AD**:")
-            # Aggregate by name to avoid duplicates
-            name_to_extras: Dict[str, Dict[str, str]] = {}
-            for name, ex in groups[key]:
-                if name not in name_to_extras:
-                    name_to_extras[name] = dict(ex)
-                else:
-                    # crude merge: keep first non-empty values
-                    for k, v in ex.items():
-                        if k not in name_to_extras[name] or not name_to_extras[name][k]:
-                            name_to_extras[name][k] = v
-
-            for biomarker_name in sorted(name_to_extras.keys()):
-                ex = name_to_extras[biomarker_name]
-                ex_bits = []
-                if "class" in ex:
-                    ex_bits.append(ex["class"])
-                if "effect_size" in ex:
-                    ex_bits.append(f"effect_size={ex['effect_size']}")
-                if "p" in ex:
-                    ex_bits.append(f"p={ex['p']}")
-                if ex_bits:
-                    lines.append(f"  • {biomarker_name} ({', '.join(ex_bits)})")
-                else:
-                    lines.append(f"  • {biomarker_name}")
-            lines.append("")  # blank line between direction groups
-
-        if section_started:
-            lines.append("")  # blank line between fluid sections
-
-    return "\n".join(lines).rstrip() + "\n"
+        {
+            "biomarker_id": ...,
+            "biomarker_label": ...,
+            "analyte": ...,
+            "analyte_class": ...,
+            "fluid": ...,
+            "direction": ...,
+            "effect_size": ...,
+            "p_value": ...,
+            ...
+        }
+
+    Output: structured text grouped by fluid + direction.
+    """
+    summary = BiomarkerSummary()
+    for row in biomarkers:
+        summary.update(row)
+    return summary.render_lines()
+
+
+def summarize_biomarkers(biomarkers: List[Dict[str, object]]) -> str:
+    """summarize_biomarkers_lines(...) as a newline-terminated string."""
+    return "\n".join(summarize_biomarkers_lines(biomarkers)) + "\n"
 
 
 # ---------------------------------------------------------------------------
@@ -225,20 +308,36 @@ def _drug_bucket(row: Dict[str, object]) -> str:
     - trial_phase_max
     - has_phase3
     """
-    status_overall = _safe_str(row.get("status_overall")).lower()
-    trial_status = _safe_str(row.get("trial_status")).lower()
     phase = row.get("trial_phase_max")
-    has_phase3 = row.get("has_phase3")
+    try:
+        phase_val = float(phase) if phase not in (None, "") else None
+    except Exception:
+        phase_val = None
+    return _drug_bucket_for(
+        _safe_str(row.get("status_overall")),
+        _safe_str(row.get("trial_status")),
+        row.get("has_phase3") in (True, "True", "true"),
+        phase_val,
+    )
+
+
+# A drug list only has a handful of distinct status / phase combinations,
+# so the substring rules are evaluated once per combination.
+@lru_cache(maxsize=256)
+def _drug_bucket_for(
+    status_overall: str,
+    trial_status: str,
+    has_phase3: bool,
+    phase_val: Optional[float],
+) -> str:
+    status_overall = status_overall.lower()
+    trial_status = trial_status.lower()
 
     # "Approved / Phase 3 or beyond"
     if "approved" in status_overall:
         return "Approved or marketed"
-    if has_phase3 in (True, "True", "true"):
+    if has_phase3:
         return "Phase 3 trials"
-    try:
-        phase_val = float(phase) if phase not in (None, "") else None
-    except Exception:
-        phase_val = None
     if phase_val is not None and phase_val >= 3.0:
         return "Phase 3 trials"
 
@@ -255,7 +354,7 @@ def _drug_bucket(row: Dict[str, object]) -> str:
     return "Status unclear / other"
 
 
-def summarize_drugs(drugs: List[Dict[str, object]]) -> str:
+def summarize_drugs_lines(drugs: List[Dict[str, object]]) -> List[str]:
     """
     Ultra-compact summary of AD drugs / therapeutics.
 
@@ -275,30 +374,36 @@ def summarize_drugs(drugs: List[Dict[str, object]]) -> str:
         }
     """
     if not drugs:
-        return "No AD therapeutics were found in the graph.\n"
+        return ["No AD therapeutics were found in the graph."]
 
-    bucket_to_drugs: Dict[str, List[str]] = defaultdict(list)
-    drug_meta: Dict[str, Dict[str, str]] = {}
+    # bucket -> {name: meta}; a repeated name simply overwrites its entry
+    bucket_to_drug_meta: Dict[str, Dict[str, Dict[str, str]]] = defaultdict(dict)
 
     for row in drugs:
-        name = _safe_str(row.get("drug_label")) or _safe_str(row.get("drug_id"))
+        get = row.get
+        label, drug_id = _row_strs(row, ("drug_label", "drug_id"))
+        name = label or drug_id
         if not name:
             continue
 
         bucket = _drug_bucket(row)
-        bucket_to_drugs[bucket].append(name)
 
+        # raw values: the presence checks look at the value itself, and
+        # anything that passes them is not None, so str() == _safe_str()
+        drug_type, drug_class, max_phase, trial_status = (
+            get("drug_type"), get("drug_class"), get("trial_phase_max"), get("trial_status")
+        )
         meta = {}
-        if row.get("drug_type"):
-            meta["type"] = _safe_str(row.get("drug_type"))
-        if row.get("drug_class"):
-            meta["class"] = _safe_str(row.get("drug_class"))
-        if row.get("trial_phase_max") not in (None, ""):
-            meta["max_phase"] = _safe_str(row.get("trial_phase_max"))
-        if row.get("trial_status"):
-            meta["trial_status"] = _safe_str(row.get("trial_status"))
+        if drug_type:
+            meta["type"] = str(drug_type)
+        if drug_class:
+            meta["class"] = str(drug_class)
+        if max_phase not in (None, ""):
+            meta["max_phase"] = str(max_phase)
+        if trial_status:
+            meta["trial_status"] = str(trial_status)
 
-        drug_meta[name] = meta
+        bucket_to_drug_meta[bucket][name] = meta
 
     lines: List[str] = []
     lines.append("### Therapeutics targeting Alzheimer’s disease")
@@ -318,13 +423,12 @@ def summarize_drugs(drugs: List[Dict[str, object]]) -> str:
     ]
 
     for bucket in order:
-        names = bucket_to_drugs.get(bucket)
-        if not names:
+        name_to_meta = bucket_to_drug_meta.get(bucket)
+        if not name_to_meta:
             continue
 
         lines.append(f"#### {bucket}")
-        for name in sorted(_dedupe_preserve_order(names)):
-            meta = drug_meta.get(name, {})
+        for name, meta in sorted(name_to_meta.items()):
             bits = []
             if meta.get("type"):
                 bits.append(meta["type"])
@@ -340,7 +444,12 @@ def summarize_drugs(drugs: List[Dict[str, object]]) -> str:
                 lines.append(f"- {name}")
         lines.append("")
 
-    return "\n".join(lines).rstrip() + "\n"
+    return _trim_tail(lines)
+
+
+def summarize_drugs(drugs: List[Dict[str, object]]) -> str:
+    """summarize_drugs_lines(...) as a newline-terminated string."""
+    return "\n".join(summarize_drugs_lines(drugs)) + "\n"
 
 
 # ---------------------------------------------------------------------------
@@ -348,7 +457,7 @@ def summarize_drugs(drugs: List[Dict[str, object]]) -> str:
 # ---------------------------------------------------------------------------
 
 
-def summarize_phenotypes(phenos: List[Dict[str, object]]) -> str:
+def summarize_phenotypes_lines(phenos: List[Dict[str, object]]) -> List[str]:
     """
     Ultra-compact list of phenotypes / symptoms.
 
@@ -362,7 +471,7 @@ def summarize_phenotypes(phenos: List[Dict[str, object]]) -> str:
         }
     """
     if not phenos:
-        return "No phenotype / symptom data found for Alzheimer’s disease.\n"
+        return ["No phenotype / symptom data found for Alzheimer’s disease."]
 
     lines: List[str] = []
     lines.append("### Clinical phenotypes / symptoms of Alzheimer’s disease")
@@ -372,12 +481,16 @@ def summarize_phenotypes(phenos: List[Dict[str, object]]) -> str:
     )
     lines.append("")
 
-    for row in sorted(phenos, key=lambda r: _safe_str(r.get("phenotype_label"))):
-        label = _safe_str(row.get("phenotype_label")) or _safe_str(
-            row.get("phenotype_id")
-        )
-        onset = _safe_str(row.get("onset"))
-        freq = _safe_str(row.get("frequency"))
+    # Extract each row's fields once, then sort those tuples on the label
+    # (stable, so rows with equal labels keep their query order).
+    rows = [
+        _row_strs(row, ("phenotype_label", "phenotype_id", "onset", "frequency"))
+        for row in phenos
+    ]
+    rows.sort(key=itemgetter(0))
+
+    for label, phenotype_id, onset, freq in rows:
+        label = label or phenotype_id
 
         bits = []
         if onset:
@@ -391,7 +504,12 @@ def summarize_phenotypes(phenos: List[Dict[str, object]]) -> str:
             lines.append(f"- {label}")
     lines.append("")
 
-    return "\n".join(lines).rstrip() + "\n"
+    return _trim_tail(lines)
+
+
+def summarize_phenotypes(phenos: List[Dict[str, object]]) -> str:
+    """summarize_phenotypes_lines(...) as a newline-terminated string."""
+    return "\n".join(summarize_phenotypes_lines(phenos)) + "\n"
 
 
 # ---------------------------------------------------------------------------
@@ -399,7 +517,7 @@ def summarize_phenotypes(phenos: List[Dict[str, object]]) -> str:
 # ---------------------------------------------------------------------------
 
 
-def summarize_drug_pathways(drug_pathways: List[Dict[str, object]]) -> str:
+def summarize_drug_pathways_lines(drug_pathways: List[Dict[str, object]]) -> List[str]:
     """
     Ultra-compact summary of pathways affected by AD drugs.
 
@@ -417,27 +535,28 @@ def summarize_drug_pathways(drug_pathways: List[Dict[str, object]]) -> str:
         }
     """
     if not drug_pathways:
-        return "No pathway-level drug mechanism information was found.\n"
+        return ["No pathway-level drug mechanism information was found."]
 
     # Group by drug
     drug_to_paths: Dict[str, List[Tuple[str, Dict[str, str]]]] = defaultdict(list)
 
     for row in drug_pathways:
-        drug_name = _safe_str(row.get("drug_label")) or _safe_str(row.get("drug_id"))
+        drug_label, drug_id, pathway_label, pathway_id = _row_strs(
+            row, ("drug_label", "drug_id", "pathway_label", "pathway_id")
+        )
+        drug_name = drug_label or drug_id
         if not drug_name:
             continue
 
-        pathway = (
-            _safe_str(row.get("pathway_label"))
-            or _safe_str(row.get("pathway_id"))
-            or "Unknown pathway"
-        )
+        pathway = pathway_label or pathway_id or "Unknown pathway"
 
+        get = row.get
+        action_type, is_primary = get("action_type"), get("is_primary_target")
         extras = {}
-        if row.get("action_type"):
-            extras["action_type"] = _safe_str(row.get("action_type"))
-        if row.get("is_primary_target") not in (None, ""):
-            extras["primary"] = _safe_str(row.get("is_primary_target"))
+        if action_type:
+            extras["action_type"] = str(action_type)
+        if is_primary not in (None, ""):
+            extras["primary"] = str(is_primary)
 
         drug_to_paths[drug_name].append((pathway, extras))
 
@@ -451,11 +570,11 @@ def summarize_drug_pathways(drug_pathways: List[Dict[str, object]]) -> str:
 
     for drug_name in sorted(drug_to_paths.keys()):
         lines.append(f"#### {drug_name}")
-        seen_paths = set()
+        seen_paths = set()  # pathway names already listed for this drug
         for pathway, extras in drug_to_paths[drug_name]:
-            if (drug_name, pathway) in seen_paths:
+            if pathway in seen_paths:
                 continue
-            seen_paths.add((drug_name, pathway))
+            seen_paths.add(pathway)
 
             bits = []
             if "action_type" in extras:
@@ -468,18 +587,26 @@ def summarize_drug_pathways(drug_pathways: List[Dict[str, object]]) -> str:
                 lines.append(f"- {pathway}")
         lines.append("")
 
-    return "\n".join(lines).rstrip() + "\n"
+    return _trim_tail(lines)
+
+
+def summarize_drug_pathways(drug_pathways: List[Dict[str, object]]) -> str:
+    """summarize_drug_pathways_lines(...) as a newline-terminated string."""
+    return "\n".join(summarize_drug_pathways_lines(drug_pathways)) + "\n"
 
 
 # ---------------------------------------------------------------------------
 # Genes and proteins
 # ---------------------------------------------------------------------------
 
+# Well-known AD genes, listed first when present (matched on the upper-cased symbol)
+_PREFERRED_GENE_PREFIXES = ("APOE", "APP", "MAPT", "PSEN1", "PSEN2")
 
-def summarize_genes_proteins(
+
+def summarize_genes_proteins_lines(
     genes_proteins: List[Dict[str, object]],
     max_items: int = 15,
-) -> str:
+) -> List[str]:
     """
     Summarize a small subset of Gene -> Protein relationships.
 
@@ -496,7 +623,7 @@ def summarize_genes_proteins(
     without flooding the context.
     """
     if not genes_proteins:
-        return "No Gene -> Protein encoding relationships were found.\n"
+        return ["No Gene -> Protein encoding relationships were found."]
 
     lines: List[str] = []
     lines.append("### Example Gene → Protein relationships")
@@ -506,10 +633,11 @@ def summarize_genes_proteins(
     )
     lines.append("")
 
-    # Prefer well-known AD genes if present
-    preferred_prefixes = ("APOE", "APP", "MAPT", "PSEN1", "PSEN2")
-    preferred: List[str] = []
-    others: List[str] = []
+    # Prefer well-known AD genes if present. Lines are de-duplicated as they
+    # arrive (dict keys), which lets the scan stop as soon as max_items
+    # preferred lines are known, and skip formatting surplus "other" lines.
+    preferred: Dict[str, None] = {}
+    others: Dict[str, None] = {}
 
     for row in genes_proteins:
         gene_symbol = _safe_str(row.get("gene_symbol")) or _safe_str(row.get("gene_id"))
@@ -519,18 +647,27 @@ def summarize_genes_proteins(
         if not gene_symbol or not protein_label:
             continue
 
-        line = f"- Gene {gene_symbol} encodes protein {protein_label}."
-        if any(gene_symbol.upper().startswith(pref) for pref in preferred_prefixes):
-            preferred.append(line)
-        else:
-            others.append(line)
+        if gene_symbol.upper().startswith(_PREFERRED_GENE_PREFIXES):
+            preferred[f"- Gene {gene_symbol} encodes protein {protein_label}."] = None
+            if 0 < max_items <= len(preferred):
+                break
+        elif not 0 < max_items <= len(others):
+            others[f"- Gene {gene_symbol} encodes protein {protein_label}."] = None
 
-    ordered = _dedupe_preserve_order(preferred) + _dedupe_preserve_order(others)
+    ordered = list(preferred) + list(others)
     for line in ordered[:max_items]:
         lines.append(line)
     lines.append("")
 
-    return "\n".join(lines).rstrip() + "\n"
+    return _trim_tail(lines)
+
+
+def summarize_genes_proteins(
+    genes_proteins: List[Dict[str, object]],
+    max_items: int = 15,
+) -> str:
+    """summarize_genes_proteins_lines(...) as a newline-terminated string."""
+    return "\n".join(summarize_genes_proteins_lines(genes_proteins, max_items)) + "\n"
 
 
 # ---------------------------------------------------------------------------
@@ -564,19 +701,18 @@ def build_ad_ultra_compact_context_from_lists(
     )
     lines.append("")
 
-    # Sections
-    lines.append(summarize_biomarkers(biomarkers).rstrip())
-    lines.append("")
-    lines.append(summarize_drugs(drugs).rstrip())
+    # Sections (each already trimmed), one blank line apart
+    lines.extend(summarize_biomarkers_lines(biomarkers))
     lines.append("")
-    lines.append(summarize_phenotypes(phenotypes).rstrip())
+    lines.extend(summarize_drugs_lines(drugs))
     lines.append("")
-    lines.append(summarize_drug_pathways(drug_pathways).rstrip())
+    lines.extend(summarize_phenotypes_lines(phenotypes))
     lines.append("")
-    lines.append(summarize_genes_proteins(genes_proteins).rstrip())
+    lines.extend(summarize_drug_pathways_lines(drug_pathways))
     lines.append("")
+    lines.extend(summarize_genes_proteins_lines(genes_proteins))
 
-    return "\n".join(lines).rstrip() + "\n"
+    return "\n".join(lines) + "\n"
 
 
 # ---------------------------------------------------------------------------
@@ -584,9 +720,39 @@ def build_ad_ultra_compact_context_from_lists(
 # ---------------------------------------------------------------------------
 
 
+# Per-retriever memo of graph lookups that do not change while the graph is
+# loaded: the AD node id and the general context text. Keyed on id(retriever)
+# with a weakref guard (GraphRetriever is an unhashable dataclass), so a
+# recycled id never returns another retriever's entry.
+_AD_DISEASE_ID_CACHE: Dict[int, Tuple[weakref.ref, str]] = {}
+_GENERAL_CONTEXT_CACHE: Dict[int, Tuple[weakref.ref, str]] = {}
+
+
+def _cache_get(cache: Dict[int, Tuple[weakref.ref, str]], retriever: object) -> Optional[str]:
+    entry = cache.get(id(retriever))
+    if entry is not None and entry[0]() is retriever:
+        return entry[1]
+    return None
+
+
+def _cache_put(cache: Dict[int, Tuple[weakref.ref, str]], retriever: object, value: str) -> None:
+    key = id(retriever)
+    cache[key] = (weakref.ref(retriever, lambda _ref: cache.pop(key, None)), value)
+
+
+def clear_graph_context_cache() -> None:
+    """Forget memoised AD ids / general contexts (e.g. after reloading the graph)."""
+    _AD_DISEASE_ID_CACHE.clear()
+    _GENERAL_CONTEXT_CACHE.clear()
+
+
 def _resolve_ad_disease_id(retriever: GraphRetriever) -> Optional[str]:
+    did = _cache_get(_AD_DISEASE_ID_CACHE, retriever)
+    if did:
+        return did
     did = retriever.get_alzheimers_disease_id()
     if did:
+        _cache_put(_AD_DISEASE_ID_CACHE, retriever, did)
         return did
     # Fallback to config if retriever couldn't find it
     return getattr(CONFIG, "ad_disease_id", None)
@@ -629,7 +795,7 @@ def build_biomarker_direction_context(
         "additional biomarkers.",
     ]
 
-    return "\n".join(header) + "\n" + summarize_biomarkers(biomarkers).rstrip() + "\n" + "\n".join(tail)
+    return "\n".join(header + summarize_biomarkers_lines(biomarkers) + tail)
 
 
 def build_phenotype_context(
@@ -668,7 +834,7 @@ def build_phenotype_context(
         "instead of inventing new symptoms.",
     ]
 
-    return "\n".join(header) + "\n" + summarize_phenotypes(phenos).rstrip() + "\n" + "\n".join(tail)
+    return "\n".join(header + summarize_phenotypes_lines(phenos) + tail)
 
 
 def build_drug_trial_pathway_context(
@@ -713,15 +879,12 @@ def build_drug_trial_pathway_context(
         "context. Do NOT invent new drugs or pathways.",
     ]
 
-    parts = [
-        "\n".join(header),
-        summarize_drugs(drugs).rstrip(),
-        "",
-        summarize_drug_pathways(drug_pws).rstrip(),
-        "",
-        "\n".join(tail),
-    ]
-    return "\n".join(parts)
+    lines = header + summarize_drugs_lines(drugs)
+    lines.append("")
+    lines.extend(summarize_drug_pathways_lines(drug_pws))
+    lines.append("")
+    lines.extend(tail)
+    return "\n".join(lines)
 
 
 def build_general_ad_context(retriever: GraphRetriever) -> str:
@@ -730,7 +893,16 @@ def build_general_ad_context(retriever: GraphRetriever) -> str:
     across biomarkers, drugs, phenotypes, pathways, and genes/proteins.
 
     This is used for GENERAL intent (and as a safe default).
+
+    The five graph queries are independent, so they run concurrently
+    (each retriever call opens its own session on the thread-safe driver);
+    latency is the slowest query rather than the sum. The resulting text is
+    memoised per retriever (see clear_graph_context_cache).
     """
+    cached = _cache_get(_GENERAL_CONTEXT_CACHE, retriever)
+    if cached is not None:
+        return cached
+
     disease_id = _resolve_ad_disease_id(retriever)
     if not disease_id:
         return (
@@ -738,31 +910,41 @@ def build_general_ad_context(retriever: GraphRetriever) -> str:
             "No general context is available."
         )
 
-    biomarkers = retriever.get_ad_biomarkers(disease_id)
-    drugs = retriever.get_ad_drugs(disease_id)
-    phenos = retriever.get_ad_phenotypes(disease_id)
-    drug_pws = retriever.get_ad_drug_pathways(disease_id)
-    genes_proteins = retriever.get_genes_and_proteins()
+    with ThreadPoolExecutor(max_workers=5) as ex:
+        biomarkers = ex.submit(retriever.get_ad_biomarkers, disease_id)
+        drugs = ex.submit(retriever.get_ad_drugs, disease_id)
+        phenos = ex.submit(retriever.get_ad_phenotypes, disease_id)
+        drug_pws = ex.submit(retriever.get_ad_drug_pathways, disease_id)
+        genes_proteins = ex.submit(retriever.get_genes_and_proteins)
 
-    return build_ad_ultra_compact_context_from_lists(
+    context = build_ad_ultra_compact_context_from_lists(
         disease_id=disease_id,
-        biomarkers=biomarkers,
-        drugs=drugs,
-        phenotypes=phenos,
-        drug_pathways=drug_pws,
-        genes_proteins=genes_proteins,
+        biomarkers=biomarkers.result(),
+        drugs=drugs.result(),
+        phenotypes=phenos.result(),
+        drug_pathways=drug_pws.result(),
+        genes_proteins=genes_proteins.result(),
     )
+    _cache_put(_GENERAL_CONTEXT_CACHE, retriever, context)
+    return context
 
 
 __all__ = [
+    "BiomarkerSummary",
     "summarize_biomarkers",
     "summarize_drugs",
     "summarize_phenotypes",
     "summarize_drug_pathways",
     "summarize_genes_proteins",
+    "summarize_biomarkers_lines",
+    "summarize_drugs_lines",
+    "summarize_phenotypes_lines",
+    "summarize_drug_pathways_lines",
+    "summarize_genes_proteins_lines",
     "build_ad_ultra_compact_context_from_lists",
     "build_biomarker_direction_context",
     "build_phenotype_context",
     "build_drug_trial_pathway_context",
     "build_general_ad_context",
+    "clear_graph_context_cache",
 ]
\ No newline at end of file
@@ -26,7 +26,8 @@ from __future__ import annotations
 import re
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List
+from functools import lru_cache
+from typing import List, Tuple
 
 
 class IntentType(Enum):
@@ -87,16 +88,97 @@ ID_PATTERNS = [
 ]
 
 
+# All ID patterns as one alternation, so the question is scanned once
+_ID_RE = re.compile("|".join(ID_PATTERNS))
+# Prefix -> position in ID_PATTERNS (results keep the old per-pattern order)
+_ID_PREFIX_RANK = {pat.split(":", 1)[0]: i for i, pat in enumerate(ID_PATTERNS)}
+
+
 def _extract_potential_ids(text: str) -> List[str]:
     """Extract MONDO/HP/GO/CHEBI/HGNC/PR-style IDs from the question."""
-    found: List[str] = []
-    for pat in ID_PATTERNS:
-        for match in re.findall(pat, text):
-            if match not in found:
-                found.append(match)
+    found = list(dict.fromkeys(_ID_RE.findall(text)))
+    if len(found) > 1:
+        found.sort(key=lambda m: _ID_PREFIX_RANK[m.split(":", 1)[0]])
     return found
 
 
+# Obvious "domain" keywords per intent bucket (substring matches on the
+# lower-cased question); module-level so they are built once.
+_BIOMARKER_KEYWORDS = (
+    "biomarker",
+    "marker",
+    "csf",
+    "plasma",
+    "serum",
+    "fluid",
+    "cutoff",
+    "sensitivity",
+    "specificity",
+)
+
+_DRUG_KEYWORDS = (
+    "drug",
+    "treat",
+    "treatment",
+    "therapy",
+    "therapeutic",
+    "compound",
+    "trial",
+    "phase",
+    "phase 2",
+    "phase 3",
+    "approved",
+    "approval",
+    "status",
+    "dosage",
+    "dose",
+    "company",
+)
+
+_PHENOTYPE_KEYWORDS = (
+    "symptom",
+    "sign",
+    "clinical feature",
+    "cognitive",
+    "memory",
+    "language",
+    "aphasia",
+    "behavior",
+    "behaviour",
+    "phenotype",
+    "presentation",
+)
+
+_PATHWAY_KEYWORDS = (
+    "pathway",
+    "pathways",
+    "go:",
+    "signaling",
+    "signalling",
+    "microglial",
+    "synaptic",
+    "amyloid cascade",
+)
+
+_GENE_PROTEIN_KEYWORDS = (
+    "gene",
+    "genes",
+    "protein",
+    "proteins",
+    "encode",
+    "encodes",
+    "mutation",
+    "variant",
+    "variants",
+    "hgnc",
+    "uniprot",
+)
+
+
+def _count_hits(words: Tuple[str, ...], q: str) -> int:
+    return sum(1 for w in words if w in q)
+
+
 def classify_question(question: str) -> QueryIntent:
     """
     Classify a question into one of the IntentType categories.
@@ -110,104 +192,56 @@ def classify_question(question: str) -> QueryIntent:
     classifier, but keep the same function signature.
     """
     q_raw = question or ""
+    primary_intent, ids, notes = _classify(q_raw)
+    # Fresh (mutable) QueryIntent per call; only the immutable parts are cached
+    return QueryIntent(
+        type=primary_intent,
+        focus_entities=list(ids),
+        raw_question=q_raw,
+        notes=notes,
+    )
+
+
+# Classification is a pure function of the question text, and UIs often
+# re-ask the same question (retries, reloads).
+@lru_cache(maxsize=1024)
+def _classify(q_raw: str) -> Tuple[IntentType, Tuple[str, ...], str]:
     q = q_raw.lower()
 
     # -----------------------------------------------------------------
-    # 1) Identify obvious "domain" keywords
+    # 1) Extract any explicit IDs (MONDO, HP, GO, etc.)
     # -----------------------------------------------------------------
-    biomarker_keywords = [
-        "biomarker",
-        "marker",
-        "csf",
-        "plasma",
-        "serum",
-        "fluid",
-        "cutoff",
-        "sensitivity",
-        "specificity",
-    ]
-
-    drug_keywords = [
-        "drug",
-        "treat",
-        "treatment",
-        "therapy",
-        "therapeutic",
-        "compound",
-        "trial",
-        "phase",
-        "phase 2",
-        "phase 3",
-        "approved",
-        "approval",
-        "status",
-        "dosage",
-        "dose",
-        "company",
-    ]
-
-    phenotype_keywords = [
-        "symptom",
-        "sign",
-        "clinical feature",
-        "cognitive",
-        "memory",
-        "language",
-        "aphasia",
-        "behavior",
-        "behaviour",
-        "phenotype",
-        "presentation",
-    ]
-
-    pathway_keywords = [
-        "pathway",
-        "pathways",
-        "go:",
-        "signaling",
-        "signalling",
-        "microglial",
-        "synaptic",
-        "amyloid cascade",
-    ]
-
-    gene_protein_keywords = [
-        "gene",
-        "genes",
-        "protein",
-        "proteins",
-        "encode",
-        "encodes",
-        "mutation",
-        "variant",
-        "variants",
-        "hgnc",
-        "uniprot",
-    ]
+    ids = tuple(_extract_potential_ids(q_raw))
 
     # -----------------------------------------------------------------
-    # 2) Score each intent bucket based on keyword hits
+    # 2) Explicit mentions decide the intent outright, so the bucket
+    #    scan is skipped for them. "trial"/"phase" are drug keywords and
+    #    used to override a "biomarker(s)" mention too, so check them first.
     # -----------------------------------------------------------------
-    def count_hits(words: List[str]) -> int:
-        return sum(1 for w in words if w in q)
+    if "trial" in q or "phase" in q:
+        return IntentType.DRUG_TRIAL, ids, "Selected DRUG_TRIAL due to trial/phase mention."
 
-    biomarker_hits = count_hits(biomarker_keywords)
-    drug_hits = count_hits(drug_keywords)
-    phenotype_hits = count_hits(phenotype_keywords)
-    pathway_hits = count_hits(pathway_keywords)
-    gene_protein_hits = count_hits(gene_protein_keywords)
+    if "biomarker" in q:  # also covers "biomarkers"
+        return (
+            IntentType.BIOMARKER,
+            ids,
+            "Selected BIOMARKER due to explicit 'biomarker(s)' mention.",
+        )
 
     # -----------------------------------------------------------------
-    # 3) Decide primary intent based on strongest signal
+    # 3) Score each intent bucket based on keyword hits
     # -----------------------------------------------------------------
     scores = {
-        IntentType.BIOMARKER: biomarker_hits,
-        IntentType.DRUG_TRIAL: drug_hits,
-        IntentType.PHENOTYPE: phenotype_hits,
-        IntentType.PATHWAY: pathway_hits,
-        IntentType.GENE_PROTEIN: gene_protein_hits,
+        IntentType.BIOMARKER: _count_hits(_BIOMARKER_KEYWORDS, q),
+        IntentType.DRUG_TRIAL: _count_hits(_DRUG_KEYWORDS, q),
+        IntentType.PHENOTYPE: _count_hits(_PHENOTYPE_KEYWORDS, q),
+        IntentType.PATHWAY: _count_hits(_PATHWAY_KEYWORDS, q),
+        IntentType.GENE_PROTEIN: _count_hits(_GENE_PROTEIN_KEYWORDS, q),
     }
 
+    # -----------------------------------------------------------------
+    # 4) Decide primary intent based on strongest signal
+    # -----------------------------------------------------------------
     # pick the intent with the highest score
     primary_intent = max(scores, key=scores.get)
     max_score = scores[primary_intent]
@@ -224,29 +258,4 @@ def classify_question(question: str) -> QueryIntent:
     else:
         notes = f"Selected {primary_intent.name} based on keyword hits: {scores}"
 
-    # -----------------------------------------------------------------
-    # 4) Extract any explicit IDs (MONDO, HP, GO, etc.)
-    # -----------------------------------------------------------------
-    ids = _extract_potential_ids(q_raw)
-
-    # -----------------------------------------------------------------
-    # 5) Heuristic: if user mentions “biomarker(s)” explicitly,
-    #    we should bias to BIOMARKER even if there are other hits.
-    # -----------------------------------------------------------------
-    if "biomarker" in q or "biomarkers" in q:
-        if primary_intent != IntentType.BIOMARKER:
-            notes += " Overridden to BIOMARKER due to explicit 'biomarker(s)' mention."
-        primary_intent = IntentType.BIOMARKER
-
-    # Similarly, if "trial" or "phase" is present, we strongly bias DRUG_TRIAL.
-    if "trial" in q or "phase" in q:
-        if primary_intent != IntentType.DRUG_TRIAL and drug_hits > 0:
-            notes += " Overridden to DRUG_TRIAL due to trial/phase mention."
-            primary_intent = IntentType.DRUG_TRIAL
-
-    return QueryIntent(
-        type=primary_intent,
-        focus_entities=ids,
-        raw_question=q_raw,
-        notes=notes,
-    )
\ No newline at end of file
+    return primary_intent, ids, notes
@@ -20,14 +20,33 @@ Docs: https://github.com/ollama/ollama
 
 from __future__ import annotations
 
-from dataclasses import dataclass
-from typing import Any, Dict, List, Optional
+import json
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 import requests
 
 from .config import CONFIG
 
 
+# Default system prompt for simple_qa() (RAG-style answering)
+_DEFAULT_RAG_SYSTEM_PROMPT = (
+    "You are a **grounded extraction assistant**.\n"
+    "\n"
+    "CRITICAL RULES:\n"
+    "- You MUST use ONLY facts that appear explicitly in the provided context.\n"
+    "- Do NOT introduce any biomarker, drug, gene, or concept that is not "
+    "literally present in the context text.\n"
+    "- Do NOT rely on your own medical knowledge or outside information.\n"
+    "- If the question asks for information that is not clearly present in "
+    "the context, say: \"The context is insufficient to answer this precisely.\"\n"
+    "- When listing entities, copy their names EXACTLY as written in the context.\n"
+    "\n"
+    "Your job is to extract and summarize, not to guess or generalize."
+)
+
+
 # ---------------------------------------------------------------------
 # Dataclasses
 # ---------------------------------------------------------------------
@@ -62,6 +81,11 @@ class LLMClient:
     default_num_ctx: int = 4096
     timeout: int = 120
 
+    # One keep-alive connection pool per client (see close())
+    _session: requests.Session = field(
+        default_factory=requests.Session, init=False, repr=False, compare=False
+    )
+
     # ------------------------------------------------------------------
     # Core chat interface
     # ------------------------------------------------------------------
@@ -94,6 +118,35 @@ class LLMClient:
         -------
         The assistant's response content as a plain string.
         """
+        payload = self._build_payload(
+            messages,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            top_p=top_p,
+            num_ctx=num_ctx,
+            max_tokens=max_tokens,
+            stream=False,
+        )
+
+        resp = self._post_chat(payload)
+
+        data = resp.json()
+        # Non-streaming /chat returns a single message object
+        message = data.get("message") or {}
+        content = message.get("content", "")
+        return content
+
+    def _build_payload(
+        self,
+        messages: List[Dict[str, str]],
+        *,
+        system_prompt: Optional[str],
+        temperature: Optional[float],
+        top_p: Optional[float],
+        num_ctx: Optional[int],
+        max_tokens: Optional[int],
+        stream: bool,
+    ) -> Dict[str, Any]:
         # Prepend system message if provided
         final_messages: List[Dict[str, str]] = []
         if system_prompt:
@@ -103,7 +156,7 @@ class LLMClient:
         payload: Dict[str, Any] = {
             "model": self.model,
             "messages": final_messages,
-            "stream": False,
+            "stream": stream,
             "options": {
                 "temperature": temperature if temperature is not None else self.default_temperature,
                 "top_p": top_p if top_p is not None else self.default_top_p,
@@ -115,9 +168,12 @@ class LLMClient:
         if max_tokens is not None:
             payload["options"]["num_predict"] = max_tokens
 
+        return payload
+
+    def _post_chat(self, payload: Dict[str, Any], *, stream: bool = False) -> requests.Response:
         url = f"{self.base_url}/chat"
         try:
-            resp = requests.post(url, json=payload, timeout=self.timeout)
+            resp = self._session.post(url, json=payload, timeout=self.timeout, stream=stream)
         except requests.RequestException as e:
             raise RuntimeError(
                 f"Failed to connect to Ollama at {url}. "
@@ -128,12 +184,51 @@ class LLMClient:
             raise RuntimeError(
                 f"Ollama returned status {resp.status_code}: {resp.text[:500]}"
             )
+        return resp
 
-        data = resp.json()
-        # Non-streaming /chat returns a single message object
-        message = data.get("message") or {}
-        content = message.get("content", "")
-        return content
+    def chat_stream(
+        self,
+        messages: List[Dict[str, str]],
+        *,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        top_p: Optional[float] = None,
+        num_ctx: Optional[int] = None,
+        max_tokens: Optional[int] = None,
+    ) -> Iterator[str]:
+        """
+        Streaming variant of `.chat()`: yields the assistant's content
+        chunk by chunk as Ollama generates it (same parameters).
+
+        "".join(client.chat_stream(...)) gives the same text as `.chat()`.
+        """
+        payload = self._build_payload(
+            messages,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            top_p=top_p,
+            num_ctx=num_ctx,
+            max_tokens=max_tokens,
+            stream=True,
+        )
+
+        # Streaming /chat returns one JSON object per line
+        with self._post_chat(payload, stream=True) as resp:
+            for line in resp.iter_lines():
+                if not line:
+                    continue
+                data = json.loads(line)
+                if data.get("error"):
+                    raise RuntimeError(f"Ollama stream error: {data['error']}")
+                content = (data.get("message") or {}).get("content", "")
+                if content:
+                    yield content
+                if data.get("done"):
+                    break
+
+    def close(self) -> None:
+        """Close the pooled HTTP connection(s) to the Ollama daemon."""
+        self._session.close()
 
     # ------------------------------------------------------------------
     # Convenience helper for RAG-style QA
@@ -170,21 +265,40 @@ class LLMClient:
         -------
         Answer string.
         """
+        system_prompt, messages = self._qa_messages(question, context, system_prompt)
+        return self.chat(
+            messages,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+    def simple_qa_stream(
+        self,
+        question: str,
+        context: str,
+        *,
+        system_prompt: Optional[str] = None,
+        temperature: Optional[float] = None,
+        max_tokens: Optional[int] = 512,
+    ) -> Iterator[str]:
+        """Streaming variant of `.simple_qa()` (yields answer chunks)."""
+        system_prompt, messages = self._qa_messages(question, context, system_prompt)
+        return self.chat_stream(
+            messages,
+            system_prompt=system_prompt,
+            temperature=temperature,
+            max_tokens=max_tokens,
+        )
+
+    @staticmethod
+    def _qa_messages(
+        question: str,
+        context: str,
+        system_prompt: Optional[str],
+    ) -> Tuple[str, List[Dict[str, str]]]:
         if system_prompt is None:
-            system_prompt = (
-                "You are a **grounded extraction assistant**.\n"
-                "\n"
-                "CRITICAL RULES:\n"
-                "- You MUST use ONLY facts that appear explicitly in the provided context.\n"
-                "- Do NOT introduce any biomarker, drug, gene, or concept that is not "
-                "literally present in the context text.\n"
-                "- Do NOT rely on your own medical knowledge or outside information.\n"
-                "- If the question asks for information that is not clearly present in "
-                "the context, say: \"The context is insufficient to answer this precisely.\"\n"
-                "- When listing entities, copy their names EXACTLY as written in the context.\n"
-                "\n"
-                "Your job is to extract and summarize, not to guess or generalize."
-            )
+            system_prompt = _DEFAULT_RAG_SYSTEM_PROMPT
 
         user_content = (
             "Context:\n"
@@ -196,22 +310,14 @@ class LLMClient:
         )
 
         messages = [{"role": "user", "content": user_content}]
-
-        return self.chat(
-            messages,
-            system_prompt=system_prompt,
-            temperature=temperature,
-            max_tokens=max_tokens,
-        )
+        return system_prompt, messages
 
 
 # ---------------------------------------------------------------------
 # Singleton-style accessor
 # ---------------------------------------------------------------------
 
-_client: Optional[LLMClient] = None
-
-
+@lru_cache(maxsize=1)
 def get_llm_client() -> LLMClient:
     """
     Get (and lazily create) the project-wide LLMClient.
@@ -219,14 +325,11 @@ def get_llm_client() -> LLMClient:
     Uses defaults from graph_rag.config.CONFIG, but you can still override
     at the instance level if needed.
     """
-    global _client
-    if _client is None:
-        _client = LLMClient(
-            base_url=CONFIG.ollama_base_url,
-            model=CONFIG.llm_model,
-            default_temperature=CONFIG.llm_temperature,
-            default_top_p=CONFIG.llm_top_p,
-            default_num_ctx=CONFIG.llm_num_ctx,
-            timeout=CONFIG.llm_timeout,
-        )
-    return _client
\ No newline at end of file
+    return LLMClient(
+        base_url=CONFIG.ollama_base_url,
+        model=CONFIG.llm_model,
+        default_temperature=CONFIG.llm_temperature,
+        default_top_p=CONFIG.llm_top_p,
+        default_num_ctx=CONFIG.llm_num_ctx,
+        timeout=CONFIG.llm_timeout,
+    )
\ No newline at end of file
@@ -32,9 +32,10 @@ client.close()
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Any, Dict, Iterable, List, Optional
 
-from neo4j import GraphDatabase, Driver, Result  # type: ignore
+from neo4j import GraphDatabase, Driver, RoutingControl  # type: ignore
 
 from .config import CONFIG
 
@@ -72,23 +73,28 @@ class Neo4jClient:
         """Close the underlying driver."""
         self._driver.close()
 
-    def _run(
+    def _execute(
         self,
         query: str,
         parameters: Optional[Dict[str, Any]] = None,
         readonly: bool = True,
-    ) -> Result:
+    ) -> List[Dict[str, Any]]:
         """
-        Run a Cypher query and return the raw neo4j.Result.
+        Run a Cypher query through the driver-managed API and return
+        list-of-dicts (record.data()).
 
-        Normally you should use .read() / .write() which wrap this and
-        return a list of dicts.
+        `driver.execute_query` borrows a pooled connection, runs the query in
+        a managed (retried) transaction routed to a reader or writer, and
+        returns fully fetched records, so nothing is read from a closed
+        session. Normally you should use .read() / .write().
         """
-        parameters = parameters or {}
-        access_mode = "READ" if readonly else "WRITE"
-        # neo4j driver uses access mode on session
-        with self._driver.session(database=self.database, default_access_mode=access_mode) as session:  # type: ignore[arg-type]
-            return session.run(query, parameters)
+        records, _, _ = self._driver.execute_query(
+            query,
+            parameters or {},
+            database_=self.database,
+            routing_=RoutingControl.READ if readonly else RoutingControl.WRITE,
+        )
+        return [record.data() for record in records]
 
     def read(
         self,
@@ -98,8 +104,7 @@ class Neo4jClient:
         """
         Run a read-only Cypher query and return list-of-dicts (record.data()).
         """
-        result = self._run(query, parameters, readonly=True)
-        return [record.data() for record in result]
+        return self._execute(query, parameters, readonly=True)
 
     def write(
         self,
@@ -109,8 +114,7 @@ class Neo4jClient:
         """
         Run a write Cypher query and return list-of-dicts (record.data()).
         """
-        result = self._run(query, parameters, readonly=False)
-        return [record.data() for record in result]
+        return self._execute(query, parameters, readonly=False)
 
     # ------------------------------------------------------------------
     # Convenience helpers used by Graph-RAG
@@ -178,21 +182,13 @@ class Neo4jClient:
             - rel  : relationship
             - nbr  : neighbor node
         """
-        if direction not in {"out", "in", "both"}:
-            raise ValueError("direction must be one of 'out', 'in', 'both'")
-
         if rel_types:
             rel_pattern = "|".join(rel_types)
             rel_pattern = f":{rel_pattern}"
         else:
             rel_pattern = ""
 
-        if direction == "out":
-            pattern = f"(n:{label} {{id: $id}})-[r{rel_pattern}]->(m)"
-        elif direction == "in":
-            pattern = f"(n:{label} {{id: $id}})<-[r{rel_pattern}]-(m)"
-        else:
-            pattern = f"(n:{label} {{id: $id}})-[r{rel_pattern}]-(m)"
+        pattern = _hop_pattern(label, rel_pattern, direction)
 
         query = f"""
         MATCH {pattern}
@@ -202,26 +198,87 @@ class Neo4jClient:
 
         return self.read(query, {"id": node_id, "limit": limit})
 
+    def neighbors_many(
+        self,
+        label: str,
+        node_id: str,
+        rel_groups: Dict[str, Optional[Iterable[str]]],
+        direction: str = "both",
+        limit_per_group: int = 200,
+    ) -> Dict[str, List[Dict[str, Any]]]:
+        """
+        Fetch 1-hop neighbors for several relationship-type groups in one
+        round-trip (instead of one .neighbors() call per group).
+
+        Parameters
+        ----------
+        rel_groups:
+            Mapping group name -> relationship types, e.g.
+            {"biomarker": ["HAS_BIOMARKER"], "drug": ["TREATS"]}.
+            A falsy value means "all types" (like rel_types=None).
+        limit_per_group:
+            Maximum number of relationships returned for each group.
+
+        Returns
+        -------
+        Dict group name -> list of {src, rel, nbr} dicts (same shape as
+        .neighbors()); every requested group is present, possibly empty.
+        """
+        groups = [
+            {"name": name, "types": list(types) if types else None}
+            for name, types in rel_groups.items()
+        ]
+        pattern = _hop_pattern(label, "", direction)
+
+        out: Dict[str, List[Dict[str, Any]]] = {g["name"]: [] for g in groups}
+        if not groups:
+            return out
+
+        # One CALL subquery per group, so LIMIT applies per group
+        query = f"""
+        UNWIND $groups AS g
+        CALL {{
+            WITH g
+            MATCH {pattern}
+            WHERE g.types IS NULL OR type(r) IN g.types
+            RETURN n AS src, r AS rel, m AS nbr
+            LIMIT $limit
+        }}
+        RETURN g.name AS group, src, rel, nbr
+        """
+
+        rows = self.read(query, {"id": node_id, "groups": groups, "limit": limit_per_group})
+        for row in rows:
+            out[row.pop("group")].append(row)
+        return out
+
+
+def _hop_pattern(label: str, rel_pattern: str, direction: str) -> str:
+    """MATCH pattern (n)-[r]-(m) around the node with the given label and $id."""
+    if direction not in {"out", "in", "both"}:
+        raise ValueError("direction must be one of 'out', 'in', 'both'")
+
+    if direction == "out":
+        return f"(n:{label} {{id: $id}})-[r{rel_pattern}]->(m)"
+    if direction == "in":
+        return f"(n:{label} {{id: $id}})<-[r{rel_pattern}]-(m)"
+    return f"(n:{label} {{id: $id}})-[r{rel_pattern}]-(m)"
+
 
 # ----------------------------------------------------------------------
 # Singleton-style accessor
 # ----------------------------------------------------------------------
 
-_client: Optional[Neo4jClient] = None
-
-
+@lru_cache(maxsize=1)
 def get_neo4j_client() -> Neo4jClient:
     """
     Get (and lazily create) a project-wide Neo4jClient instance.
 
     Uses connection settings from graph_rag.config.CONFIG by default.
     """
-    global _client
-    if _client is None:
-        _client = Neo4jClient(
-            uri=CONFIG.neo4j_uri,
-            user=CONFIG.neo4j_user,
-            password=CONFIG.neo4j_password,
-            database=CONFIG.neo4j_db,
-        )
-    return _client
\ No newline at end of file
+    return Neo4jClient(
+        uri=CONFIG.neo4j_uri,
+        user=CONFIG.neo4j_user,
+        password=CONFIG.neo4j_password,
+        database=CONFIG.neo4j_db,
+    )
\ No newline at end of file
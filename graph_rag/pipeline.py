@@ -31,13 +31,17 @@ Typical usage
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any, Dict, Optional
+from functools import lru_cache
+from typing import Any, Dict, Iterator, Optional, Tuple
 
 from fastapi import FastAPI
+from fastapi.responses import StreamingResponse
 from fastapi.middleware.cors import CORSMiddleware
 from pydantic import BaseModel
 
-from .router import build_context_for_question, RouteResult
+from .intents import IntentType, classify_question
+from .router import RouteResult, context_for_intent_type, make_route_result
+from . import graph_to_text as gtxt
 from .retriever import GraphRetriever, get_retriever
 from .llm_client import LLMClient, get_llm_client
 
@@ -72,6 +76,24 @@ class GraphRAGPipeline:
     retriever: GraphRetriever
     llm_client: LLMClient
 
+    def __post_init__(self) -> None:
+        # Graph context per intent type (the only input the v1 builders
+        # use): the KG is read-only while serving, so repeat questions of
+        # the same kind skip Neo4j entirely. Per instance, since it depends
+        # on the retriever.
+        self._context_for = lru_cache(maxsize=None)(self._build_context)
+
+    def _build_context(self, intent_type: IntentType) -> Tuple[str, str]:
+        return context_for_intent_type(intent_type, self.retriever)
+
+    def clear_context_cache(self) -> None:
+        """
+        Forget cached graph contexts (e.g. after reloading the graph),
+        including graph_to_text's memoised AD id / general context.
+        """
+        self._context_for.cache_clear()
+        gtxt.clear_graph_context_cache()
+
     # ------------------------------------------------------------------
     # Main entrypoint
     # ------------------------------------------------------------------
@@ -96,31 +118,12 @@ class GraphRAGPipeline:
         """
 
         # 1) Route question → intent + context
-        route: RouteResult = build_context_for_question(
-            question=question,
-            retriever=self.retriever,
-        )
+        route, prompt_question = self._route(question)
 
         # 2) If the KG is missing the AD node, don't call the LLM
-        if "does not appear to contain an Alzheimer's" in route.context:
+        if prompt_question is None:
             answer_text = route.context
         else:
-            # Build an enriched question that encodes intent + safety constraints
-            intent_label = route.intent.type.name
-            prompt_question = (
-                "You are an assistant answering questions *strictly* based on the "
-                "Alzheimer’s disease graph context provided separately.\n\n"
-                f"Query type (intent): {intent_label}\n"
-                "Rules:\n"
-                "1. Use only the information in the context. Do NOT invent biomarkers, "
-                "drugs, genes, or symptoms that are not explicitly listed.\n"
-                "2. If the context does not contain enough information to answer "
-                "part of the question, say so explicitly.\n"
-                "3. When listing items (biomarkers, drugs, pathways, phenotypes), "
-                "only mention entities that you see in the context text.\n\n"
-                f"User question: {question}"
-            )
-
             # If temperature is not given, you can force 0.0 here for max determinism
             effective_temp = 0.0 if temperature is None else temperature
 
@@ -146,30 +149,78 @@ class GraphRAGPipeline:
 
         return result
 
+    def answer_stream(
+        self,
+        question: str,
+        *,
+        temperature: Optional[float] = None,
+        max_tokens: int = 400,
+    ) -> Iterator[str]:
+        """
+        Streaming variant of `.answer()`: yields the answer text chunk by
+        chunk as the LLM generates it (no metadata), so a client can show
+        the first tokens without waiting for the full generation.
+        """
+        route, prompt_question = self._route(question)
+        if prompt_question is None:
+            yield route.context
+            return
+
+        effective_temp = 0.0 if temperature is None else temperature
+        yield from self.llm_client.simple_qa_stream(
+            question=prompt_question,
+            context=route.context,
+            temperature=effective_temp,
+            max_tokens=max_tokens,
+        )
+
+    def _route(self, question: str) -> Tuple[RouteResult, Optional[str]]:
+        """
+        Route the question and build the enriched LLM question; the latter
+        is None when the KG is missing the AD node (answer = route.context).
+        """
+        intent = classify_question(question)
+        strategy_name, context = self._context_for(intent.type)
+        route: RouteResult = make_route_result(intent, context, strategy_name)
+        if "does not appear to contain an Alzheimer's" in route.context:
+            return route, None
+
+        # Build an enriched question that encodes intent + safety constraints
+        intent_label = route.intent.type.name
+        prompt_question = (
+            "You are an assistant answering questions *strictly* based on the "
+            "Alzheimer’s disease graph context provided separately.\n\n"
+            f"Query type (intent): {intent_label}\n"
+            "Rules:\n"
+            "1. Use only the information in the context. Do NOT invent biomarkers, "
+            "drugs, genes, or symptoms that are not explicitly listed.\n"
+            "2. If the context does not contain enough information to answer "
+            "part of the question, say so explicitly.\n"
+            "3. When listing items (biomarkers, drugs, pathways, phenotypes), "
+            "only mention entities that you see in the context text.\n\n"
+            f"User question: {question}"
+        )
+        return route, prompt_question
+
 
 # ---------------------------------------------------------------------
 # Singleton-style accessor
 # ---------------------------------------------------------------------
 
 
-_pipeline: Optional[GraphRAGPipeline] = None
-
-
+@lru_cache(maxsize=1)
 def get_pipeline() -> GraphRAGPipeline:
     """
     Get (and lazily create) the project-wide GraphRAGPipeline.
 
     Uses the shared GraphRetriever + LLMClient singletons.
     """
-    global _pipeline
-    if _pipeline is None:
-        retriever = get_retriever()
-        llm_client = get_llm_client()
-        _pipeline = GraphRAGPipeline(
-            retriever=retriever,
-            llm_client=llm_client,
-        )
-    return _pipeline
+    retriever = get_retriever()
+    llm_client = get_llm_client()
+    return GraphRAGPipeline(
+        retriever=retriever,
+        llm_client=llm_client,
+    )
 
 
 # ---------------------------------------------------------------------
@@ -217,7 +268,6 @@ def answer_question(payload: QuestionRequest) -> AnswerResponse:
         return_context=payload.return_context,
     )
 
-    print("res['answer']: ", res["answer"])
     return AnswerResponse(
         answer=res["answer"],
         intent_type=res["intent_type"],
@@ -227,6 +277,18 @@ def answer_question(payload: QuestionRequest) -> AnswerResponse:
     )
 
 
+@app.post("/answer_stream")
+def answer_question_stream(payload: QuestionRequest) -> StreamingResponse:
+    """Same as /answer, but streams the answer text as it is generated."""
+    pipe = get_pipeline()
+    chunks = pipe.answer_stream(
+        question=payload.question,
+        temperature=payload.temperature,
+        max_tokens=payload.max_tokens,
+    )
+    return StreamingResponse(chunks, media_type="text/plain; charset=utf-8")
+
+
 # ---------------------------------------------------------------------
 # Tiny CLI-style smoke test (optional)
 # ---------------------------------------------------------------------
@@ -21,6 +21,7 @@ strings. LLM calls are done via `graph_rag.llm_client`.
 from __future__ import annotations
 
 from dataclasses import dataclass
+from functools import lru_cache
 from typing import Dict, List, Optional, Any
 
 
@@ -309,21 +310,16 @@ class GraphRetriever:
 # ---------------------------------------------------------------------
 
 
-_retriever: Optional[GraphRetriever] = None
-
-
+@lru_cache(maxsize=1)
 def get_retriever() -> GraphRetriever:
     """
     Get (and lazily create) the project-wide GraphRetriever.
 
     Uses connection details from `graph_rag.config.CONFIG`.
     """
-    global _retriever
-    if _retriever is None:
-        _retriever = GraphRetriever(
-            uri=CONFIG.neo4j_uri,
-            user=CONFIG.neo4j_user,
-            password=CONFIG.neo4j_password,
-            database=CONFIG.neo4j_db,
-        )
-    return _retriever
\ No newline at end of file
+    return GraphRetriever(
+        uri=CONFIG.neo4j_uri,
+        user=CONFIG.neo4j_user,
+        password=CONFIG.neo4j_password,
+        database=CONFIG.neo4j_db,
+    )
\ No newline at end of file
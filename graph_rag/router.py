@@ -17,7 +17,7 @@ the context ultra-compact and relevant.
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Dict, Optional
+from typing import Dict, Optional, Tuple
 
 from .intents import QueryIntent, IntentType, classify_question
 from .retriever import GraphRetriever, get_retriever
@@ -94,8 +94,26 @@ def build_context_for_question(
     # 1) Classify the question into an intent
     intent = classify_question(question)
 
-    # 2) Pick an intent-specific context builder
-    #
+    # 2) Build the intent-specific context
+    strategy_name, context = context_for_intent_type(intent.type, retriever)
+
+    return make_route_result(intent, context, strategy_name)
+
+
+def context_for_intent_type(
+    intent_type: IntentType,
+    retriever: GraphRetriever,
+) -> Tuple[str, str]:
+    """
+    Pick the intent-specific context builder and run it.
+
+    The context only depends on the intent type (and the graph), which
+    lets callers reuse it across questions of the same kind.
+
+    Returns
+    -------
+    (strategy_name, context)
+    """
     #    BIOMARKER     -> biomarker-only, grouped by fluid + direction
     #    PHENOTYPE     -> phenotype/symptom-only
     #    DRUG_TRIAL    -> drugs + trials + pathways
@@ -103,28 +121,25 @@ def build_context_for_question(
     #    GENE_PROTEIN  -> fall back to general AD context (includes genes)
     #    GENERAL       -> general AD context (all sections)
     #
-    if intent.type is IntentType.BIOMARKER:
-        strategy_name = "AD_BIOMARKERS_V1"
-        context = gtxt.build_biomarker_direction_context(retriever)
+    if intent_type is IntentType.BIOMARKER:
+        return "AD_BIOMARKERS_V1", gtxt.build_biomarker_direction_context(retriever)
 
-    elif intent.type is IntentType.PHENOTYPE:
-        strategy_name = "AD_PHENOTYPES_V1"
-        context = gtxt.build_phenotype_context(retriever)
+    if intent_type is IntentType.PHENOTYPE:
+        return "AD_PHENOTYPES_V1", gtxt.build_phenotype_context(retriever)
 
-    elif intent.type in (IntentType.DRUG_TRIAL, IntentType.PATHWAY):
-        strategy_name = "AD_DRUGS_PATHWAYS_V1"
-        context = gtxt.build_drug_trial_pathway_context(retriever)
+    if intent_type in (IntentType.DRUG_TRIAL, IntentType.PATHWAY):
+        return "AD_DRUGS_PATHWAYS_V1", gtxt.build_drug_trial_pathway_context(retriever)
 
-    elif intent.type is IntentType.GENE_PROTEIN:
+    if intent_type is IntentType.GENE_PROTEIN:
         # For now, reuse the general context (includes gene/protein section).
-        strategy_name = "AD_GENES_GENERAL_V1"
-        context = gtxt.build_general_ad_context(retriever)
+        return "AD_GENES_GENERAL_V1", gtxt.build_general_ad_context(retriever)
+
+    # Fallback: general compact Alzheimer’s graph summary.
+    return "AD_GENERAL_V1", gtxt.build_general_ad_context(retriever)
 
-    else:
-        # Fallback: general compact Alzheimer’s graph summary.
-        strategy_name = "AD_GENERAL_V1"
-        context = gtxt.build_general_ad_context(retriever)
 
+def make_route_result(intent: QueryIntent, context: str, strategy_name: str) -> RouteResult:
+    """Wrap an intent + built context into a RouteResult (with debug info)."""
     debug: Dict[str, str] = {
         "intent_type": intent.type.name,
         "intent_notes": intent.notes,